@@ -5,7 +5,9 @@ Main agent class with model integration
 
 import os
 import json
+import asyncio
 import logging
+from collections import Counter
 from typing import List, Dict, Optional
 from together import Together
 
@@ -85,6 +87,59 @@ class PloiPepe:
         Returns:
             Generated response text
         """
+        return self._complete(prompt, conversation_history, 1, **kwargs)[0]
+    
+    async def generate_async(
+        self,
+        prompt: str,
+        conversation_history: Optional[List[Dict[str, str]]] = None,
+        **kwargs
+    ) -> str:
+        """Generate a response without blocking the event loop"""
+        return await asyncio.to_thread(self.generate, prompt, conversation_history, **kwargs)
+    
+    async def generate_batch_async(self, prompts: List[str], **kwargs) -> List[str]:
+        """
+        Generate one response per prompt.
+        Repeats of the same prompt share a single request asking for several
+        completions, and distinct prompts are requested concurrently.
+        
+        Args:
+            prompts: Prompts to answer (may repeat)
+            **kwargs: Override generation parameters
+        
+        Returns:
+            Generated texts, in prompt order; prompts whose request failed
+            are left out
+        """
+        counts = Counter(prompts)
+        batches = await asyncio.gather(*(
+            asyncio.to_thread(self._complete, prompt, None, n, **kwargs)
+            for prompt, n in counts.items()
+        ), return_exceptions=True)
+        
+        pending = {}
+        for prompt, texts in zip(counts, batches):
+            if isinstance(texts, Exception):
+                logger.warning(f"Dropping {counts[prompt]} response(s) for a failed prompt: {texts}")
+                continue
+            pending[prompt] = iter(texts)
+        
+        responses = []
+        for prompt in prompts:
+            text = next(pending.get(prompt, iter(())), None)
+            if text is not None:
+                responses.append(text)
+        return responses
+    
+    def _complete(
+        self,
+        prompt: str,
+        conversation_history: Optional[List[Dict[str, str]]],
+        n: int,
+        **kwargs
+    ) -> List[str]:
+        """Request n completions for one prompt"""
         # Build messages array
         messages = [{"role": "system", "content": self.system_prompt}]
         
@@ -103,6 +158,9 @@ class PloiPepe:
             "max_tokens": kwargs.get("max_tokens", self.max_tokens),
         }
         
+        if n > 1:
+            gen_params["n"] = n
+        
         try:
             response = self.client.chat.completions.create(
                 model=self.model_id,
@@ -110,9 +168,9 @@ class PloiPepe:
                 **gen_params
             )
             
-            generated_text = response.choices[0].message.content
-            logger.info(f"Generated response ({len(generated_text)} chars)")
-            return generated_text
+            texts = [choice.message.content for choice in response.choices]
+            logger.info(f"Generated {len(texts)} response(s) ({sum(len(t) for t in texts)} chars)")
+            return texts
             
         except Exception as e:
             logger.error(f"Generation failed: {e}")
@@ -9,17 +9,109 @@ Based on Pump.fun bonding curve contract:
 """
 
 import os
+import asyncio
 import logging
+import random
 import requests
 import time
 import json
 import base64
-from typing import Optional, Dict
+import struct
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Optional, Dict, List, Tuple, BinaryIO
 from pathlib import Path
 from image_generator import TokenImageGenerator
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
+# Persistent connection to PumpPortal, reused across trades (HTTP/2 when available)
+try:
+    import httpx
+    _HTTP = httpx.Client(
+        http2=True,
+        timeout=10.0,
+        limits=httpx.Limits(max_keepalive_connections=10)
+    )
+except ImportError:
+    _HTTP = requests.Session()
+
 logger = logging.getLogger(__name__)
 
+# Program IDs
+_PUMP_PROGRAM_ID = "6EF8rrecthR5Dkzon8Nwu78hRvfCKubJ14M5uBEwF6P"  # Mainnet
+_METAPLEX_PROGRAM_ID = "metaqbxxUerdq28cj1RbAWkYQm3ybzjb6a8bt518x1s"
+
+# PDA seeds
+_METADATA_SEED = b"metadata"
+_BONDING_CURVE_SEED = b"bonding-curve"
+
+# Solana dependencies are imported once here rather than on every deploy;
+# constant pubkeys are decoded once as well
+try:
+    from solana.rpc.api import Client
+    from solana.rpc.commitment import Confirmed
+    from solana.rpc.types import TxOpts
+    from solders.keypair import Keypair
+    from solders.pubkey import Pubkey
+    from solders.system_program import create_account, CreateAccountParams
+    from solders.transaction import VersionedTransaction
+    from solders.message import MessageV0
+    from solders.instruction import Instruction, AccountMeta
+    from solders.compute_budget import set_compute_unit_limit, set_compute_unit_price
+
+    _TOKEN_PROGRAM = Pubkey.from_string("TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA")
+    _METADATA_PROGRAM = Pubkey.from_string(_METAPLEX_PROGRAM_ID)
+    _PUMP_PROGRAM = Pubkey.from_string(_PUMP_PROGRAM_ID)
+    _SYSTEM_PROGRAM = Pubkey.from_string("11111111111111111111111111111111")
+    _RENT = Pubkey.from_string("SysvarRent111111111111111111111111111111111")
+    _ASSOCIATED_TOKEN_PROGRAM = Pubkey.from_string("ATokenGPvbdGVxr1b2hvZbsiqW5xWH25efTNsLJA8knL")
+
+    _TOKEN_PROGRAM_BYTES = bytes(_TOKEN_PROGRAM)
+    _METADATA_PROGRAM_BYTES = bytes(_METADATA_PROGRAM)
+    SOLANA_AVAILABLE = True
+except ImportError:
+    # Token ideas still work without the Solana stack
+    SOLANA_AVAILABLE = False
+
+# Precompiled little-endian integer formats
+_U8 = struct.Struct("<B")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+
+# Metaplex CreateMetadataAccountV3
+_CREATE_METADATA_V3_DISCRIMINATOR = _U8.pack(33)
+# seller_fee_basis_points = 0, creators/collection/uses = None,
+# is_mutable = true, collection_details = None
+_METADATA_TAIL = _U16.pack(0) + bytes((0, 0, 0, 1, 0))
+
+# Pump.fun "create" (needs verification against the actual program)
+_PUMP_CREATE_DISCRIMINATOR = _U64.pack(0x181ec828051c0777)
+
+
+def _write_string(buf: bytearray, s: str):
+    """Append string to buf with 4-byte length prefix"""
+    b = s.encode('utf-8')
+    buf += _U32.pack(len(b))
+    buf += b
+
+
+# Token idea building blocks
+_PREFIXES = ("Pepe", "Frog", "Based", "Chad", "Moon", "Degen")
+_SUFFIXES = ("Coin", "Token", "Finance", "Protocol", "DAO", "")
+_THEMES = ("just vibing", "taking it easy", "feels good man", "comfy frog life")
+
+# Derives mint accounts in the background while IPFS uploads are in flight
+_MINT_DERIVER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pump-mint")
+
 
 class PumpFunDeployer:
     """
@@ -28,8 +120,8 @@ class PumpFunDeployer:
     """
     
     # Pump.fun program IDs
-    PUMP_PROGRAM = "6EF8rrecthR5Dkzon8Nwu78hRvfCKubJ14M5uBEwF6P"  # Mainnet
-    METAPLEX_PROGRAM = "metaqbxxUerdq28cj1RbAWkYQm3ybzjb6a8bt518x1s"
+    PUMP_PROGRAM = _PUMP_PROGRAM_ID
+    METAPLEX_PROGRAM = _METAPLEX_PROGRAM_ID
     
     def __init__(self, wallet, network: str = "devnet"):
         """
@@ -41,6 +133,8 @@ class PumpFunDeployer:
         """
         self.wallet = wallet
         self.network = network
+        self._rpc_client = None
+        self._broadcast_clients = None
         logger.info(f"PumpFun deployer initialized on {network}")
     
     def create_token(
@@ -52,7 +146,8 @@ class PumpFunDeployer:
         telegram: str = "",
         website: str = "",
         image_path: Optional[str] = None,
-        initial_buy: float = 0.0
+        initial_buy: float = 0.0,
+        background_derive: bool = True
     ) -> Optional[Dict]:
         """
         Create a token on Pump.fun.
@@ -73,6 +168,9 @@ class PumpFunDeployer:
             website: Website URL (optional)
             image_path: Path to token image (optional)
             initial_buy: SOL amount for initial buy (optional)
+            background_derive: Derive the mint accounts on the shared helper
+                thread while uploads run; pass False when already running in
+                a worker thread so concurrent deploys don't queue on it
         
         Returns:
             Token info dict with mint address, or None if failed
@@ -80,12 +178,21 @@ class PumpFunDeployer:
         try:
             logger.info(f"Creating token: {name} ({symbol})")
             
+            # Derive the mint keypair and PDAs while the uploads below run
+            mint_accounts = None
+            if background_derive and self.network != "devnet" and SOLANA_AVAILABLE:
+                mint_accounts = _MINT_DERIVER.submit(self._derive_mint_accounts)
+            
             # Step 1: Generate or upload image
             image_uri = None
-            if image_path and Path(image_path).exists():
+            if image_path:
                 # Use provided image
-                logger.info("Uploading provided image to IPFS...")
-                image_uri = self._upload_to_ipfs(image_path)
+                try:
+                    with open(image_path, 'rb') as f:
+                        logger.info("Uploading provided image to IPFS...")
+                        image_uri = self._upload_to_ipfs(f, Path(image_path).name)
+                except OSError as e:
+                    logger.warning(f"Could not open provided image: {e}")
                 if not image_uri:
                     logger.warning("Image upload failed, will auto-generate")
             
@@ -102,7 +209,8 @@ class PumpFunDeployer:
                 
                 if generated_path:
                     logger.info(f"Generated image: {generated_path}")
-                    image_uri = self._upload_to_ipfs(generated_path)
+                    with open(generated_path, 'rb') as f:
+                        image_uri = self._upload_to_ipfs(f, Path(generated_path).name)
                     if not image_uri:
                         logger.warning("Failed to upload generated image")
                 else:
@@ -147,7 +255,8 @@ class PumpFunDeployer:
                 name=name,
                 symbol=symbol,
                 uri=metadata_uri,
-                initial_buy=initial_buy
+                initial_buy=initial_buy,
+                mint_accounts=mint_accounts
             )
             
             if result:
@@ -164,10 +273,65 @@ class PumpFunDeployer:
             traceback.print_exc()
             return None
     
-    def _upload_to_ipfs(self, file_path: str) -> Optional[str]:
+    async def create_tokens_batch(
+        self,
+        ideas: List[Dict],
+        max_concurrency: int = 5
+    ) -> List[Optional[Dict]]:
+        """
+        Create several tokens concurrently.
+        
+        Each deploy runs in a worker thread so IPFS uploads and RPC
+        round-trips overlap across tokens instead of running back to back.
+        
+        Args:
+            ideas: Token dicts with name, symbol, description (see generate_token_idea)
+            max_concurrency: Maximum deploys in flight at once
+        
+        Returns:
+            One result per idea, in order (None for failed deploys)
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def deploy(idea: Dict) -> Optional[Dict]:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self.create_token,
+                    name=idea["name"],
+                    symbol=idea["symbol"],
+                    description=idea["description"],
+                    twitter=idea.get("twitter", ""),
+                    telegram=idea.get("telegram", ""),
+                    website=idea.get("website", ""),
+                    image_path=idea.get("image_path"),
+                    initial_buy=idea.get("initial_buy", 0.0),
+                    # Each deploy has its own thread; derive the mint there
+                    background_derive=False
+                )
+        
+        results = await asyncio.gather(
+            *(deploy(idea) for idea in ideas),
+            return_exceptions=True
+        )
+        
+        created = []
+        for idea, result in zip(ideas, results):
+            if isinstance(result, Exception):
+                logger.error(f"Batch deploy of {idea.get('name')} failed: {result}")
+                result = None
+            created.append(result)
+        
+        logger.info(f"Batch deploy finished: {sum(1 for r in created if r)}/{len(ideas)} created")
+        return created
+    
+    def _upload_to_ipfs(self, file: BinaryIO, filename: str) -> Optional[str]:
         """
         Upload image to IPFS using nft.storage or similar service.
         
+        Args:
+            file: Image opened in binary mode (streamed, not re-opened)
+            filename: Name to upload the image as
+        
         Returns IPFS URL (ipfs://...)
         """
         try:
@@ -176,25 +340,35 @@ class PumpFunDeployer:
             if not api_key:
                 logger.warning("No NFT_STORAGE_API_KEY found, using placeholder")
                 # Return placeholder for testing
-                return f"https://placeholder.com/{Path(file_path).name}"
+                return f"https://placeholder.com/{filename}"
             
             # Upload to NFT.Storage
-            with open(file_path, 'rb') as f:
-                files = {'file': f}
-                headers = {'Authorization': f'Bearer {api_key}'}
+            headers = {'Authorization': f'Bearer {api_key}'}
+            if MultipartEncoder is not None:
+                # Stream the file in chunks instead of buffering the whole body
+                encoder = MultipartEncoder(
+                    fields={'file': (filename, file, 'image/png')}
+                )
+                headers['Content-Type'] = encoder.content_type
                 response = requests.post(
                     'https://api.nft.storage/upload',
-                    files=files,
+                    data=encoder,
                     headers=headers
                 )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    cid = data['value']['cid']
-                    return f"ipfs://{cid}"
-                else:
-                    logger.error(f"IPFS upload failed: {response.text}")
-                    return None
+            else:
+                response = requests.post(
+                    'https://api.nft.storage/upload',
+                    files={'file': (filename, file)},
+                    headers=headers
+                )
+            
+            if response.status_code == 200:
+                data = response.json()
+                cid = data['value']['cid']
+                return f"ipfs://{cid}"
+            else:
+                logger.error(f"IPFS upload failed: {response.text}")
+                return None
         except Exception as e:
             logger.error(f"Image upload failed: {e}")
             return None
@@ -209,7 +383,10 @@ class PumpFunDeployer:
                 return f"https://placeholder.com/metadata.json"
             
             # Convert to JSON
-            json_data = json.dumps(metadata).encode('utf-8')
+            if orjson is not None:
+                json_data = orjson.dumps(metadata)
+            else:
+                json_data = json.dumps(metadata).encode('utf-8')
             
             headers = {
                 'Authorization': f'Bearer {api_key}',
@@ -238,7 +415,8 @@ class PumpFunDeployer:
         name: str,
         symbol: str,
         uri: str,
-        initial_buy: float = 0.0
+        initial_buy: float = 0.0,
+        mint_accounts: Optional[Future] = None
     ) -> Optional[Dict]:
         """
         Create token using Pump.fun bonding curve.
@@ -251,20 +429,15 @@ class PumpFunDeployer:
         5. Create associated token accounts
         6. Initialize Pump.fun curve
         7. Optional initial buy transaction
+        
+        If mint_accounts is given it must resolve to the tuple returned by
+        _derive_mint_accounts; otherwise the accounts are derived inline.
         """
+        if not SOLANA_AVAILABLE:
+            logger.error("Solana dependencies not installed. Run: pip install solana solders")
+            return None
+        
         try:
-            from solana.rpc.api import Client
-            from solana.rpc.commitment import Confirmed
-            from solana.rpc.types import TxOpts
-            from solders.keypair import Keypair
-            from solders.pubkey import Pubkey
-            from solders.system_program import create_account, CreateAccountParams
-            from solders.transaction import VersionedTransaction
-            from solders.message import MessageV0
-            from solders.instruction import Instruction, AccountMeta
-            from solders.compute_budget import set_compute_unit_limit, set_compute_unit_price
-            import struct
-            
             logger.info("Building Pump.fun token creation transaction...")
             
             if self.network == "devnet":
@@ -272,162 +445,116 @@ class PumpFunDeployer:
                 logger.info("Creating simulated token for devnet testing")
                 return self._simulate_token_creation(name, symbol, uri)
             
-            # Initialize RPC client
-            rpc_url = os.getenv("SOLANA_RPC_URL", "https://api.mainnet-beta.solana.com")
-            client = Client(rpc_url)
+            client = self._get_rpc_client()
             
-            # Generate new mint keypair
-            mint_keypair = Keypair()
+            # Generate new mint keypair and derive its PDAs
+            if mint_accounts is not None:
+                mint_keypair, metadata_pda, bonding_curve, curve_token_account = mint_accounts.result()
+            else:
+                mint_keypair, metadata_pda, bonding_curve, curve_token_account = self._derive_mint_accounts()
             mint = mint_keypair.pubkey()
             
             logger.info(f"Mint address: {mint}")
-            
-            # Program IDs
-            TOKEN_PROGRAM = Pubkey.from_string("TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA")
-            METADATA_PROGRAM = Pubkey.from_string(self.METAPLEX_PROGRAM)
-            PUMP_PROGRAM = Pubkey.from_string(self.PUMP_PROGRAM)
-            SYSTEM_PROGRAM = Pubkey.from_string("11111111111111111111111111111111")
-            RENT = Pubkey.from_string("SysvarRent111111111111111111111111111111111")
-            
-            # Derive metadata PDA
-            metadata_seeds = [
-                b"metadata",
-                bytes(METADATA_PROGRAM),
-                bytes(mint)
-            ]
-            metadata_pda, metadata_bump = Pubkey.find_program_address(
-                metadata_seeds,
-                METADATA_PROGRAM
-            )
-            
-            # Derive bonding curve PDA
-            bonding_curve_seeds = [
-                b"bonding-curve",
-                bytes(mint)
-            ]
-            bonding_curve, curve_bump = Pubkey.find_program_address(
-                bonding_curve_seeds,
-                PUMP_PROGRAM
-            )
-            
-            # Derive associated bonding curve token account
-            ASSOCIATED_TOKEN_PROGRAM = Pubkey.from_string(
-                "ATokenGPvbdGVxr1b2hvZbsiqW5xWH25efTNsLJA8knL"
-            )
-            curve_token_seeds = [
-                bytes(bonding_curve),
-                bytes(TOKEN_PROGRAM),
-                bytes(mint)
-            ]
-            curve_token_account, _ = Pubkey.find_program_address(
-                curve_token_seeds,
-                ASSOCIATED_TOKEN_PROGRAM
-            )
-            
             logger.info(f"Bonding curve: {bonding_curve}")
             logger.info(f"Metadata: {metadata_pda}")
             
-            # Build instructions
-            instructions = []
+            payer = self.wallet.keypair.pubkey()
             
-            # 1. Set compute budget (important for complex transactions)
-            instructions.append(
-                set_compute_unit_limit(400_000)  # Increase compute units
-            )
-            instructions.append(
-                set_compute_unit_price(50_000)  # Priority fee in microlamports
-            )
-            
-            # 2. Create mint account
+            # Mint account rent (82 bytes = SPL mint size)
             mint_rent = client.get_minimum_balance_for_rent_exemption(82).value
-            instructions.append(
-                create_account(
-                    CreateAccountParams(
-                        from_pubkey=self.wallet.keypair.pubkey(),
-                        to_pubkey=mint,
-                        lamports=mint_rent,
-                        space=82,
-                        owner=TOKEN_PROGRAM
-                    )
-                )
-            )
             
-            # 3. Initialize mint (6 decimals, mint authority = wallet initially)
+            # Initialize mint (6 decimals, mint authority = wallet initially)
             # SPL Token InitializeMint instruction format:
             # [0] u8 instruction discriminator (0 = InitializeMint)
             # [1-32] Pubkey mint_authority
             # [33] u8 decimals  
             # [34] Option<Pubkey> freeze_authority (1 byte for Some(0)/None(1), then 32 bytes if Some)
-            init_mint_data = bytes([0]) + bytes(self.wallet.keypair.pubkey()) + bytes([6]) + bytes([1]) + bytes(32)  # None for freeze authority
-            
-            instructions.append(
-                Instruction(
-                    program_id=TOKEN_PROGRAM,
-                    accounts=[
-                        AccountMeta(pubkey=mint, is_signer=False, is_writable=True),
-                        AccountMeta(pubkey=RENT, is_signer=False, is_writable=False),
-                    ],
-                    data=init_mint_data
-                )
-            )
+            init_mint_data = bytearray(67)  # [0] discriminator and trailing freeze authority stay zeroed
+            init_mint_data[1:33] = bytes(payer)
+            init_mint_data[33] = 6
+            init_mint_data[34] = 1  # None for freeze authority
             
-            # 4. Create Metaplex metadata account
             metadata_data = self._build_metadata_instruction(
                 metadata_pda,
                 mint,
-                self.wallet.keypair.pubkey(),
+                payer,
                 name,
                 symbol,
                 uri
             )
             
-            instructions.append(
-                Instruction(
-                    program_id=METADATA_PROGRAM,
-                    accounts=[
-                        AccountMeta(pubkey=metadata_pda, is_signer=False, is_writable=True),  # metadata account
-                        AccountMeta(pubkey=mint, is_signer=True, is_writable=False),  # mint (must be signer)
-                        AccountMeta(pubkey=self.wallet.keypair.pubkey(), is_signer=True, is_writable=False),  # mint authority
-                        AccountMeta(pubkey=self.wallet.keypair.pubkey(), is_signer=True, is_writable=True),  # payer
-                        AccountMeta(pubkey=self.wallet.keypair.pubkey(), is_signer=True, is_writable=False),  # update authority
-                        AccountMeta(pubkey=SYSTEM_PROGRAM, is_signer=False, is_writable=False),
-                        AccountMeta(pubkey=RENT, is_signer=False, is_writable=False),
-                    ],
-                    data=metadata_data
-                )
-            )
-            
-            # 5. Initialize Pump.fun bonding curve
             pump_init_data = self._build_pump_init_instruction(
                 name,
                 symbol,
                 uri
             )
             
-            instructions.append(
+            # Build instructions (fixed shape, so one list literal)
+            instructions = [
+                # 1. Set compute budget (important for complex transactions)
+                set_compute_unit_limit(400_000),  # Increase compute units
+                set_compute_unit_price(50_000),  # Priority fee in microlamports
+                
+                # 2. Create mint account
+                create_account(
+                    CreateAccountParams(
+                        from_pubkey=payer,
+                        to_pubkey=mint,
+                        lamports=mint_rent,
+                        space=82,
+                        owner=_TOKEN_PROGRAM
+                    )
+                ),
+                
+                # 3. Initialize mint
                 Instruction(
-                    program_id=PUMP_PROGRAM,
+                    program_id=_TOKEN_PROGRAM,
+                    accounts=[
+                        AccountMeta(pubkey=mint, is_signer=False, is_writable=True),
+                        AccountMeta(pubkey=_RENT, is_signer=False, is_writable=False),
+                    ],
+                    data=bytes(init_mint_data)
+                ),
+                
+                # 4. Create Metaplex metadata account
+                Instruction(
+                    program_id=_METADATA_PROGRAM,
+                    accounts=[
+                        AccountMeta(pubkey=metadata_pda, is_signer=False, is_writable=True),  # metadata account
+                        AccountMeta(pubkey=mint, is_signer=True, is_writable=False),  # mint (must be signer)
+                        AccountMeta(pubkey=payer, is_signer=True, is_writable=False),  # mint authority
+                        AccountMeta(pubkey=payer, is_signer=True, is_writable=True),  # payer
+                        AccountMeta(pubkey=payer, is_signer=True, is_writable=False),  # update authority
+                        AccountMeta(pubkey=_SYSTEM_PROGRAM, is_signer=False, is_writable=False),
+                        AccountMeta(pubkey=_RENT, is_signer=False, is_writable=False),
+                    ],
+                    data=metadata_data
+                ),
+                
+                # 5. Initialize Pump.fun bonding curve
+                Instruction(
+                    program_id=_PUMP_PROGRAM,
                     accounts=[
                         AccountMeta(pubkey=mint, is_signer=True, is_writable=True),
                         AccountMeta(pubkey=bonding_curve, is_signer=False, is_writable=True),
                         AccountMeta(pubkey=curve_token_account, is_signer=False, is_writable=True),
-                        AccountMeta(pubkey=self.wallet.keypair.pubkey(), is_signer=True, is_writable=True),
+                        AccountMeta(pubkey=payer, is_signer=True, is_writable=True),
                         AccountMeta(pubkey=metadata_pda, is_signer=False, is_writable=False),
-                        AccountMeta(pubkey=TOKEN_PROGRAM, is_signer=False, is_writable=False),
-                        AccountMeta(pubkey=ASSOCIATED_TOKEN_PROGRAM, is_signer=False, is_writable=False),
-                        AccountMeta(pubkey=SYSTEM_PROGRAM, is_signer=False, is_writable=False),
-                        AccountMeta(pubkey=RENT, is_signer=False, is_writable=False),
+                        AccountMeta(pubkey=_TOKEN_PROGRAM, is_signer=False, is_writable=False),
+                        AccountMeta(pubkey=_ASSOCIATED_TOKEN_PROGRAM, is_signer=False, is_writable=False),
+                        AccountMeta(pubkey=_SYSTEM_PROGRAM, is_signer=False, is_writable=False),
+                        AccountMeta(pubkey=_RENT, is_signer=False, is_writable=False),
                     ],
                     data=pump_init_data
-                )
-            )
+                ),
+            ]
             
             # Get recent blockhash
             recent_blockhash = client.get_latest_blockhash().value.blockhash
             
             # Build message
             message = MessageV0.try_compile(
-                payer=self.wallet.keypair.pubkey(),
+                payer=payer,
                 instructions=instructions,
                 address_lookup_table_accounts=[],
                 recent_blockhash=recent_blockhash
@@ -438,16 +565,14 @@ class PumpFunDeployer:
             
             # Send transaction
             logger.info("Sending token creation transaction...")
-            signature = client.send_transaction(
-                tx,
-                opts=TxOpts(skip_preflight=False, preflight_commitment=Confirmed)
-            ).value
+            signature = self._broadcast_transaction(tx)
             
             logger.info(f"Transaction sent: {signature}")
             logger.info("Confirming transaction...")
             
-            # Wait for confirmation
-            client.confirm_transaction(signature, commitment=Confirmed)
+            # Wait for confirmation; without preflight this is where a failed
+            # transaction first shows up
+            self._confirm_transaction(client, signature)
             
             logger.info("✅ Transaction confirmed!")
             
@@ -481,6 +606,96 @@ class PumpFunDeployer:
             traceback.print_exc()
             return None
     
+    def _get_rpc_client(self) -> 'Client':
+        """Reuse one RPC client (and its connection pool) per deployer"""
+        if self._rpc_client is None:
+            rpc_url = os.getenv("SOLANA_RPC_URL", "https://api.mainnet-beta.solana.com")
+            self._rpc_client = Client(rpc_url)
+        return self._rpc_client
+    
+    def _get_broadcast_clients(self) -> List['Client']:
+        """Primary RPC client plus any extra SOLANA_BROADCAST_RPC_URLS"""
+        if self._broadcast_clients is None:
+            extra_urls = [
+                url.strip()
+                for url in os.getenv("SOLANA_BROADCAST_RPC_URLS", "").split(",")
+                if url.strip()
+            ]
+            self._broadcast_clients = [self._get_rpc_client()] + [Client(url) for url in extra_urls]
+        return self._broadcast_clients
+    
+    def _broadcast_transaction(self, tx: 'VersionedTransaction'):
+        """
+        Send a signed transaction without preflight simulation.
+        
+        The transaction is built locally and deterministic, so the preflight
+        round-trip is skipped. When extra RPCs are configured it is sent to
+        all of them at once and the first accepted signature wins; the
+        redundant sends stand in for RPC-side retries.
+        """
+        clients = self._get_broadcast_clients()
+        raw_tx = bytes(tx)
+        
+        if len(clients) == 1:
+            opts = TxOpts(skip_preflight=True)
+            return clients[0].send_raw_transaction(raw_tx, opts=opts).value
+        
+        opts = TxOpts(skip_preflight=True, max_retries=0)
+        pool = ThreadPoolExecutor(max_workers=len(clients))
+        try:
+            futures = [pool.submit(c.send_raw_transaction, raw_tx, opts) for c in clients]
+            errors = []
+            for future in as_completed(futures):
+                try:
+                    return future.result().value
+                except Exception as e:
+                    errors.append(e)
+            raise RuntimeError(f"All RPCs rejected the transaction: {errors}")
+        finally:
+            pool.shutdown(wait=False)
+    
+    def _confirm_transaction(self, client: 'Client', signature):
+        """Wait for a transaction to confirm and raise if it failed on-chain"""
+        response = client.confirm_transaction(signature, commitment=Confirmed)
+        status = response.value[0] if response.value else None
+        if status is None:
+            raise RuntimeError(f"No status for transaction {signature}")
+        if status.err is not None:
+            raise RuntimeError(f"Transaction {signature} failed: {status.err}")
+    
+    def _derive_mint_accounts(self) -> Tuple['Keypair', 'Pubkey', 'Pubkey', 'Pubkey']:
+        """
+        Generate a fresh mint keypair and derive its program addresses.
+        
+        Returns:
+            (mint_keypair, metadata_pda, bonding_curve, curve_token_account)
+        """
+        mint_keypair = Keypair()
+        mint_bytes = bytes(mint_keypair.pubkey())
+        
+        # Derive metadata PDA
+        metadata_seeds = (_METADATA_SEED, _METADATA_PROGRAM_BYTES, mint_bytes)
+        metadata_pda, _ = Pubkey.find_program_address(
+            metadata_seeds,
+            _METADATA_PROGRAM
+        )
+        
+        # Derive bonding curve PDA
+        bonding_curve_seeds = (_BONDING_CURVE_SEED, mint_bytes)
+        bonding_curve, _ = Pubkey.find_program_address(
+            bonding_curve_seeds,
+            _PUMP_PROGRAM
+        )
+        
+        # Derive associated bonding curve token account
+        curve_token_seeds = (bytes(bonding_curve), _TOKEN_PROGRAM_BYTES, mint_bytes)
+        curve_token_account, _ = Pubkey.find_program_address(
+            curve_token_seeds,
+            _ASSOCIATED_TOKEN_PROGRAM
+        )
+        
+        return mint_keypair, metadata_pda, bonding_curve, curve_token_account
+    
     def _simulate_token_creation(
         self,
         name: str,
@@ -488,8 +703,6 @@ class PumpFunDeployer:
         uri: str
     ) -> Dict:
         """Simulate token creation for devnet testing"""
-        from solders.keypair import Keypair
-        
         mint = Keypair()
         bonding_curve = Keypair()
         
@@ -520,11 +733,6 @@ class PumpFunDeployer:
         
         Discriminator: 33 (CreateMetadataAccountV3)
         """
-        import struct
-        
-        # Instruction discriminator
-        discriminator = struct.pack("<B", 33)
-        
         # DataV2 struct
         # - name (string)
         # - symbol (string)  
@@ -533,28 +741,14 @@ class PumpFunDeployer:
         # - creators (Option<Vec<Creator>>)
         # - collection (Option<Collection>)
         # - uses (Option<Uses>)
+        # followed by is_mutable and collection_details (see _METADATA_TAIL)
+        data = bytearray(_CREATE_METADATA_V3_DISCRIMINATOR)
+        _write_string(data, name)
+        _write_string(data, symbol)
+        _write_string(data, uri)
+        data += _METADATA_TAIL
         
-        def encode_string(s: str) -> bytes:
-            """Encode string with 4-byte length prefix"""
-            b = s.encode('utf-8')
-            return struct.pack("<I", len(b)) + b
-        
-        data = discriminator
-        data += encode_string(name)
-        data += encode_string(symbol)
-        data += encode_string(uri)
-        data += struct.pack("<H", 0)  # seller_fee_basis_points = 0
-        data += struct.pack("<B", 0)  # creators = None
-        data += struct.pack("<B", 0)  # collection = None
-        data += struct.pack("<B", 0)  # uses = None
-        
-        # is_mutable
-        data += struct.pack("<B", 1)  # true
-        
-        # collection_details (None)
-        data += struct.pack("<B", 0)
-        
-        return data
+        return bytes(data)
     
     def _build_pump_init_instruction(
         self,
@@ -568,22 +762,12 @@ class PumpFunDeployer:
         This is based on reverse engineering the Pump.fun program.
         Actual discriminator may vary - adjust based on program analysis.
         """
-        import struct
-        
-        # Instruction discriminator for "create"
-        # (This would need to be verified against actual program)
-        discriminator = struct.pack("<Q", 0x181ec828051c0777)  # Example hash
-        
-        def encode_string(s: str) -> bytes:
-            b = s.encode('utf-8')
-            return struct.pack("<I", len(b)) + b
+        data = bytearray(_PUMP_CREATE_DISCRIMINATOR)
+        _write_string(data, name)
+        _write_string(data, symbol)
+        _write_string(data, uri)
         
-        data = discriminator
-        data += encode_string(name)
-        data += encode_string(symbol)
-        data += encode_string(uri)
-        
-        return data
+        return bytes(data)
     
     def _buy_tokens(
         self,
@@ -598,11 +782,8 @@ class PumpFunDeployer:
         try:
             logger.info(f"Buying tokens: {sol_amount} SOL")
             
-            from solana.rpc.api import Client
-            from solders.transaction import VersionedTransaction
-            
             # Build buy transaction via PumpPortal
-            response = requests.post(
+            response = _HTTP.post(
                 "https://pumpportal.fun/api/trade-local",
                 json={
                     "publicKey": str(self.wallet.address),
@@ -613,7 +794,8 @@ class PumpFunDeployer:
                     "slippage": 10,
                     "priorityFee": 0.0001,
                     "pool": "pump"
-                }
+                },
+                timeout=10
             )
             
             if response.status_code != 200:
@@ -627,10 +809,7 @@ class PumpFunDeployer:
             # Sign and send
             tx.sign([self.wallet.keypair])
             
-            rpc_url = os.getenv("SOLANA_RPC_URL", "https://api.mainnet-beta.solana.com")
-            client = Client(rpc_url)
-            
-            signature = client.send_transaction(tx).value
+            signature = self._get_rpc_client().send_transaction(tx).value
             logger.info(f"Buy transaction: {signature}")
             
             return {
@@ -648,24 +827,30 @@ class PumpFunDeployer:
         Generate a token idea based on current trends.
         Pepe can use this to come up with token concepts.
         """
-        import random
-        
-        prefixes = ["Pepe", "Frog", "Based", "Chad", "Moon", "Degen"]
-        suffixes = ["Coin", "Token", "Finance", "Protocol", "DAO", ""]
-        themes = ["just vibing", "taking it easy", "feels good man", "comfy frog life"]
+        return self.generate_token_ideas(1)[0]
+    
+    def generate_token_ideas(self, n: int) -> List[Dict[str, str]]:
+        """
+        Generate n token ideas at once.
+        Samples every word list in a single call instead of per idea.
+        """
+        prefixes = random.choices(_PREFIXES, k=n)
+        suffixes = random.choices(_SUFFIXES, k=n)
+        themes = random.choices(_THEMES, k=n)
         
-        name = f"{random.choice(prefixes)} {random.choice(suffixes)}".strip()
-        symbol = name[:4].upper()
-        description = f"{name} - {random.choice(themes)}. Launched by Pepe on Solana."
+        ideas = []
+        for prefix, suffix, theme in zip(prefixes, suffixes, themes):
+            name = f"{prefix} {suffix}".strip()
+            ideas.append({
+                "name": name,
+                "symbol": name[:4].upper(),
+                "description": f"{name} - {theme}. Launched by Pepe on Solana.",
+                "twitter": "",
+                "telegram": "",
+                "website": ""
+            })
         
-        return {
-            "name": name,
-            "symbol": symbol,
-            "description": description,
-            "twitter": "",
-            "telegram": "",
-            "website": ""
-        }
+        return ideas
 
 
 # Integration with chat commands
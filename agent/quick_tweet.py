@@ -4,7 +4,9 @@ Quick tweet poster - Generate and post one tweet using Ollama
 """
 
 import os
-import requests
+import asyncio
+import aiohttp
+from functools import lru_cache
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -39,7 +41,7 @@ TWEET RULES:
 - Short tweets > long tweets"""
 
 
-def generate_tweet():
+async def generate_tweet_async(session: aiohttp.ClientSession):
     """Generate a tweet using Ollama"""
     prompt = "write a chill tweet about being on solana or memecoins or just how you're feeling today. keep it short and natural"
     
@@ -54,15 +56,15 @@ def generate_tweet():
             "options": {"temperature": 0.9, "top_p": 0.95}
         }
         
-        response = requests.post(OLLAMA_URL, json=payload, timeout=30)
-        result = response.json()
-        content = result["message"]["content"].strip()
+        async with session.post(
+            OLLAMA_URL,
+            json=payload,
+            timeout=aiohttp.ClientTimeout(total=30)
+        ) as response:
+            result = await response.json()
         
-        # Clean up quotes if model added them
-        if content.startswith('"') and content.endswith('"'):
-            content = content[1:-1]
-        if content.startswith("'") and content.endswith("'"):
-            content = content[1:-1]
+        # Clean up quotes if model added them (handles mixed quote styles too)
+        content = result["message"]["content"].strip().strip('"').strip("'")
         
         # Ensure under 280 characters
         if len(content) > 280:
@@ -74,19 +76,23 @@ def generate_tweet():
         return None
 
 
+@lru_cache(maxsize=1)
+def _get_twitter_client():
+    """Build the Twitter client once and reuse its session"""
+    import tweepy
+    
+    return tweepy.Client(
+        consumer_key=os.getenv("TWITTER_API_KEY"),
+        consumer_secret=os.getenv("TWITTER_API_SECRET"),
+        access_token=os.getenv("TWITTER_ACCESS_TOKEN"),
+        access_token_secret=os.getenv("TWITTER_ACCESS_SECRET")
+    )
+
+
 def post_tweet(text):
     """Post tweet to Twitter"""
     try:
-        import tweepy
-        
-        client = tweepy.Client(
-            consumer_key=os.getenv("TWITTER_API_KEY"),
-            consumer_secret=os.getenv("TWITTER_API_SECRET"),
-            access_token=os.getenv("TWITTER_ACCESS_TOKEN"),
-            access_token_secret=os.getenv("TWITTER_ACCESS_SECRET")
-        )
-        
-        response = client.create_tweet(text=text)
+        response = _get_twitter_client().create_tweet(text=text)
         tweet_id = response.data['id']
         
         print(f"✅ Tweet posted!")
@@ -98,28 +104,48 @@ def post_tweet(text):
         return False
 
 
-def main():
-    print("\n🐸 PLOI PEPE - Quick Tweet\n")
-    
+async def review_tweets(session: aiohttp.ClientSession):
+    """Generate tweets and ask whether to post them until one is accepted or cancelled"""
     print("🤖 Generating tweet with Ollama...")
-    tweet = generate_tweet()
+    next_tweet = asyncio.create_task(generate_tweet_async(session))
     
-    if not tweet:
-        print("❌ Failed to generate tweet")
+    while True:
+        tweet = await next_tweet
+        
+        if not tweet:
+            print("❌ Failed to generate tweet")
+            return
+        
+        print(f"\n💬 Generated tweet:\n   \"{tweet}\"\n")
+        print(f"   ({len(tweet)} characters)\n")
+        
+        # Speculatively generate the next candidate while the user decides
+        next_tweet = asyncio.create_task(generate_tweet_async(session))
+        
+        confirm = await asyncio.to_thread(input, "Post this tweet? (yes/no/retry): ")
+        confirm = confirm.strip().lower()
+        
+        if confirm == 'retry' or confirm == 'r':
+            print("\n🔄 Generating new tweet...")
+            continue
+        
+        next_tweet.cancel()
+        if confirm == 'yes' or confirm == 'y':
+            post_tweet(tweet)
+        else:
+            print("⏭️  Cancelled")
         return
-    
-    print(f"\n💬 Generated tweet:\n   \"{tweet}\"\n")
-    print(f"   ({len(tweet)} characters)\n")
-    
-    confirm = input("Post this tweet? (yes/no/retry): ").strip().lower()
-    
-    if confirm == 'yes' or confirm == 'y':
-        post_tweet(tweet)
-    elif confirm == 'retry' or confirm == 'r':
-        print("\n🔄 Generating new tweet...")
-        main()
-    else:
-        print("⏭️  Cancelled")
+
+
+async def run():
+    """Run the review flow over one shared HTTP session"""
+    async with aiohttp.ClientSession() as session:
+        await review_tweets(session)
+
+
+def main():
+    print("\n🐸 PLOI PEPE - Quick Tweet\n")
+    asyncio.run(run())
 
 
 if __name__ == "__main__":
@@ -6,13 +6,153 @@ Semantic search over past conversations for true learning
 import os
 import json
 import logging
+from collections import OrderedDict
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 import numpy as np
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Above this many memories the Faiss index switches from exact search to a
+# compressed IVF-PQ index
+IVF_PQ_THRESHOLD = 100_000
+
+# Number of encoded queries kept for repeated searches
+QUERY_CACHE_SIZE = 1024
+
+# Supported on-disk/in-memory formats for stored embeddings
+STORAGE_DTYPES = {"float32": np.float32, "float16": np.float16, "int8": np.int8}
+
+# Rows widened to float32 per block when scoring float16/int8 storage
+SCORE_BLOCK = 8192
+
+# Recent rows checked for near-duplicates before an insert
+DEDUPE_WINDOW = 128
+
+# Above this many float32 rows the exact search uses the Numba kernel
+NUMBA_MIN_ROWS = 1000
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _cosine_scores(matrix, q):
+        """Cosine similarity of each row of matrix with q"""
+        n, dim = matrix.shape
+        q_norm = 0.0
+        for j in range(dim):
+            q_norm += q[j] * q[j]
+        q_norm = np.sqrt(q_norm)
+        
+        scores = np.empty(n, dtype=np.float32)
+        for i in prange(n):
+            dot = 0.0
+            row_norm = 0.0
+            for j in range(dim):
+                dot += matrix[i, j] * q[j]
+                row_norm += matrix[i, j] * matrix[i, j]
+            denom = np.sqrt(row_norm) * q_norm
+            scores[i] = dot / denom if denom > 0 else 0.0
+        return scores
+
+
+_numba_warm = False
+
+
+def _warmup_numba():
+    """Compile the Numba kernel once so the first real query doesn't pay for it"""
+    global _numba_warm
+    if not NUMBA_AVAILABLE or _numba_warm:
+        return
+    
+    try:
+        # Match the real call: the r+ memmap store is writable, while cached
+        # query vectors are read-only, and writability is part of the signature
+        matrix = np.ones((2, 4), dtype=np.float32)
+        q = np.ones(4, dtype=np.float32)
+        q.flags.writeable = False
+        _cosine_scores(matrix, q)
+        _numba_warm = True
+    except Exception as e:
+        logger.warning(f"Numba warmup failed: {e}")
+
+
+class OnnxSentenceEncoder:
+    """
+    Sentence encoder backed by an exported (optionally int8-quantized) ONNX
+    model, e.g. from:
+    
+        optimum-cli export onnx --model sentence-transformers/all-MiniLM-L6-v2 \\
+            --optimize O3 ./minilm-onnx
+        optimum-cli onnxruntime quantize --onnx_model ./minilm-onnx \\
+            --avx512_vnni -o ./minilm-int8
+    
+    Implements the subset of SentenceTransformer.encode used by RAGMemory.
+    """
+    
+    def __init__(self, model_dir: str, max_length: int = 256):
+        import onnxruntime
+        from transformers import AutoTokenizer
+        
+        model_dir = Path(model_dir)
+        model_files = sorted(model_dir.glob("*.onnx"))
+        if not model_files:
+            raise FileNotFoundError(f"No .onnx model in {model_dir}")
+        
+        self.tokenizer = AutoTokenizer.from_pretrained(str(model_dir), use_fast=True)
+        self.session = onnxruntime.InferenceSession(
+            str(model_files[0]),
+            providers=["CPUExecutionProvider"]
+        )
+        self.input_names = {i.name for i in self.session.get_inputs()}
+        self.max_length = max_length
+    
+    def encode(
+        self,
+        sentences,
+        batch_size: int = 32,
+        convert_to_numpy: bool = True,
+        normalize_embeddings: bool = False,
+        **kwargs
+    ) -> np.ndarray:
+        """Mean-pooled sentence embeddings; a single string gives a 1-D vector"""
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+        
+        batches = []
+        for start in range(0, len(texts), batch_size):
+            tokens = self.tokenizer(
+                texts[start:start + batch_size],
+                padding=True,
+                truncation=True,
+                max_length=self.max_length,
+                return_tensors="np"
+            )
+            feed = {name: tokens[name].astype(np.int64) for name in self.input_names if name in tokens}
+            hidden = self.session.run(None, feed)[0]
+            
+            # Mean over real (non-padding) tokens, as in the sentence-transformers pooling layer
+            mask = tokens["attention_mask"][:, :, None].astype(np.float32)
+            pooled = (hidden * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9)
+            batches.append(pooled.astype(np.float32))
+        
+        embeddings = np.concatenate(batches) if batches else np.empty((0, 0), dtype=np.float32)
+        if normalize_embeddings and len(embeddings):
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings /= np.maximum(norms, 1e-12)
+        return embeddings[0] if single else embeddings
+
 
 class RAGMemory:
     """
@@ -23,7 +163,12 @@ class RAGMemory:
     def __init__(
         self,
         storage_path: str = "./data/rag_memory",
-        embedding_model: str = "all-MiniLM-L6-v2"
+        embedding_model: str = "all-MiniLM-L6-v2",
+        storage_dtype: str = "float32",
+        use_simsimd: bool = False,
+        use_faiss: bool = False,
+        onnx_model_path: Optional[str] = None,
+        dedupe_threshold: Optional[float] = 0.97
     ):
         """
         Initialize RAG memory with vector embeddings.
@@ -31,26 +176,93 @@ class RAGMemory:
         Args:
             storage_path: Directory for vector database
             embedding_model: Sentence transformer model name
+            storage_dtype: "float32", "float16" (2x smaller) or "int8" to
+                quantize stored embeddings (per-row scale, 4x smaller)
+            use_simsimd: Score the exact (non-Faiss) search with SimSIMD's
+                SIMD cosine kernels when simsimd is installed
+            use_faiss: Search with a Faiss index when faiss is installed; the
+                index keeps its own float32 copy of every vector
+            onnx_model_path: Directory with an ONNX export of the embedding
+                model (defaults to $RAG_ONNX_MODEL); falls back to
+                sentence-transformers if unset or unavailable
+            dedupe_threshold: Skip interactions at least this similar to one of
+                the last DEDUPE_WINDOW stored (None to keep everything)
         """
+        if storage_dtype not in STORAGE_DTYPES:
+            raise ValueError(f"storage_dtype must be one of {list(STORAGE_DTYPES)}")
+        
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(parents=True, exist_ok=True)
         
         self.embedding_model_name = embedding_model
+        self.onnx_model_path = onnx_model_path or os.getenv("RAG_ONNX_MODEL")
         self.embeddings_file = self.storage_path / "embeddings.npy"
-        self.metadata_file = self.storage_path / "metadata.json"
+        self.metadata_file = self.storage_path / "metadata.jsonl"
+        self.legacy_metadata_file = self.storage_path / "metadata.json"
+        self.index_file = self.storage_path / "index.faiss"
+        self.scales_file = self.storage_path / "scales.npy"
+        # Marks embeddings.npy as already L2-normalized, so loading can skip the check
+        self.normalized_file = self.storage_path / "embeddings.normalized"
         
         # Initialize components
-        self.embeddings = []
+        # Embeddings live in a preallocated, file-backed buffer of
+        # L2-normalized rows; only the first _n_used rows are valid. int8 rows
+        # carry a per-row scale in _scales (row ~= embeddings[i] * _scales[i])
+        self.storage_dtype = storage_dtype
+        self.embeddings = np.empty((0, 0), dtype=STORAGE_DTYPES[storage_dtype])
+        self._scales = np.empty(0, dtype=np.float32)
+        self._n_used = 0
+        self._is_normalized = True
         self.metadata = []
         self.encoder = None
         
+        # Metadata is an append-only JSON-lines log, opened on first write
+        self._meta_fp = None
+        
+        # Set when the files on disk couldn't be loaded; they are then left
+        # untouched rather than overwritten with rows that no longer line up
+        self._read_only = False
+        
+        self.dedupe_threshold = dedupe_threshold
+        
+        # LRU of normalized query text -> encoded query
+        self._query_cache = OrderedDict()
+        
+        # Optional Faiss index over the same rows (inner product == cosine)
+        self.use_faiss = use_faiss
+        self.faiss = None
+        self.index = None
+        
+        # Optional SimSIMD kernels for the exact search
+        self.simsimd = None
+        if use_simsimd:
+            try:
+                import simsimd
+                self.simsimd = simsimd
+            except ImportError:
+                logger.warning("simsimd not installed. Install with: pip install simsimd")
+        
         self._load_encoder()
         self._load_memory()
+        self._load_index()
         
-        logger.info(f"RAG Memory initialized with {len(self.embeddings)} stored memories")
+        if self.storage_dtype == "float32":
+            _warmup_numba()
+        
+        logger.info(f"RAG Memory initialized with {self._n_used} stored memories")
     
     def _load_encoder(self):
         """Load sentence transformer model for embeddings"""
+        if self.onnx_model_path:
+            try:
+                self.encoder = OnnxSentenceEncoder(self.onnx_model_path)
+                logger.info(f"Loaded ONNX embedding model: {self.onnx_model_path}")
+                return
+            except ImportError:
+                logger.warning("onnxruntime/transformers not installed. Install with: pip install onnxruntime transformers")
+            except Exception as e:
+                logger.error(f"Failed to load ONNX encoder: {e}")
+        
         try:
             from sentence_transformers import SentenceTransformer
             self.encoder = SentenceTransformer(self.embedding_model_name)
@@ -62,32 +274,167 @@ class RAGMemory:
             logger.error(f"Failed to load encoder: {e}")
             self.encoder = None
     
+    def _load_index(self):
+        """Load or build the Faiss index when use_faiss is set and faiss is installed"""
+        if not self.use_faiss:
+            return
+        
+        try:
+            import faiss
+            self.faiss = faiss
+        except ImportError:
+            logger.warning("faiss not installed. Install with: pip install faiss-cpu")
+            return
+        
+        try:
+            if self.index_file.exists():
+                index = faiss.read_index(str(self.index_file))
+                if index.ntotal == self._n_used:
+                    self.index = index
+                    return
+            self._build_index()
+        except Exception as e:
+            logger.error(f"Failed to load Faiss index: {e}")
+            self.index = None
+    
+    def _build_index(self):
+        """(Re)build the Faiss index from the stored embeddings"""
+        self.index = None
+        if not self.faiss or not self._n_used:
+            return
+        
+        self._ensure_normalized()
+        matrix = np.ascontiguousarray(self._float_rows(0, self._n_used))
+        dim = matrix.shape[1]
+        if self._n_used > IVF_PQ_THRESHOLD:
+            index = self.faiss.index_factory(dim, "IVF256,PQ16", self.faiss.METRIC_INNER_PRODUCT)
+            index.train(matrix)
+            self.faiss.extract_index_ivf(index).nprobe = 16
+        else:
+            index = self.faiss.IndexFlatIP(dim)
+        index.add(matrix)
+        self.index = index
+        logger.info(f"Built Faiss index with {index.ntotal} vectors")
+    
     def _load_memory(self):
         """Load existing embeddings and metadata"""
         try:
+            log_is_clean = True
+            if self.metadata_file.exists():
+                self.metadata, log_is_clean = self._read_metadata_log()
+            elif self.legacy_metadata_file.exists():
+                # Older versions rewrote one JSON array on every save
+                with open(self.legacy_metadata_file, 'rb') as f:
+                    data = f.read()
+                self.metadata = orjson.loads(data) if orjson is not None else json.loads(data)
+                self._rewrite_metadata_log()
+                self.legacy_metadata_file.unlink()
+            
             if self.embeddings_file.exists():
-                self.embeddings = np.load(self.embeddings_file).tolist()
+                # Map the file read/write; pages load on demand and new rows are
+                # written straight into it. Rows past the metadata are spare
+                # capacity (or a write that never got its metadata line)
+                embeddings = np.load(self.embeddings_file, mmap_mode='r+')
+                n = min(len(embeddings), len(self.metadata))
+                scales = None
+                converted = False
+                if embeddings.dtype == np.int8:
+                    scales = np.load(self.scales_file, mmap_mode='r+')
+                    if self.storage_dtype != "int8":
+                        # Convert if the file was written with a different storage_dtype
+                        embeddings = np.asarray(embeddings[:n], dtype=np.float32) * scales[:n, None]
+                        embeddings = embeddings.astype(STORAGE_DTYPES[self.storage_dtype])
+                        scales = None
+                        converted = True
+                elif embeddings.dtype != STORAGE_DTYPES[self.storage_dtype]:
+                    # Older files stored raw float64 embeddings; normalizing
+                    # already-normalized rows is harmless
+                    embeddings = self._normalize_rows(np.asarray(embeddings[:n], dtype=np.float32))
+                    if self.storage_dtype == "int8":
+                        embeddings, scales = self._quantize_rows(embeddings)
+                    converted = True
+                elif not self.normalized_file.exists():
+                    # Possibly raw rows from an older version; checked on first use
+                    self._is_normalized = False
+                
+                self._n_used = n
+                self.embeddings = embeddings
+                self._scales = scales if scales is not None else np.empty(0, dtype=np.float32)
+                if converted:
+                    # Write converted rows back to disk in the current format
+                    self._resize_store(max(16, n), embeddings.shape[1])
             
-            if self.metadata_file.exists():
-                with open(self.metadata_file, 'r') as f:
-                    self.metadata = json.load(f)
+            if len(self.metadata) != self._n_used or not log_is_clean:
+                # Drop a torn last line and metadata whose embedding never
+                # made it to disk, so later appends start on a clean line
+                self.metadata = self.metadata[:self._n_used]
+                self._rewrite_metadata_log()
             
-            logger.info(f"Loaded {len(self.embeddings)} memories from disk")
+            logger.info(f"Loaded {self._n_used} memories from disk")
         except Exception as e:
-            logger.error(f"Failed to load memory: {e}")
-            self.embeddings = []
+            logger.error(f"Failed to load memory, not storing new memories until it's cleared: {e}")
+            self.embeddings = np.empty((0, 0), dtype=STORAGE_DTYPES[self.storage_dtype])
+            self._scales = np.empty(0, dtype=np.float32)
+            self._n_used = 0
+            self._is_normalized = True
             self.metadata = []
+            self._read_only = True
+    
+    def _read_metadata_log(self) -> Tuple[List[Dict], bool]:
+        """
+        Read metadata.jsonl up to the first unreadable (torn) line.
+        
+        Returns:
+            (entries, whether the whole file was readable)
+        """
+        loads = orjson.loads if orjson is not None else json.loads
+        metadata = []
+        with open(self.metadata_file, 'rb') as f:
+            for line in f:
+                try:
+                    metadata.append(loads(line))
+                except ValueError:
+                    logger.warning("Dropping unreadable tail of RAG metadata log")
+                    return metadata, False
+        return metadata, True
+    
+    def _rewrite_metadata_log(self):
+        """Replace metadata.jsonl with the in-memory metadata"""
+        if self._meta_fp is not None:
+            self._meta_fp.close()
+            self._meta_fp = None
+        
+        tmp_file = self.metadata_file.with_suffix(".jsonl.tmp")
+        with open(tmp_file, 'wb') as f:
+            for entry in self.metadata:
+                f.write(self._dump_line(entry))
+        os.replace(tmp_file, self.metadata_file)
+    
+    @staticmethod
+    def _dump_line(entry: Dict) -> bytes:
+        """One metadata entry as a JSON line"""
+        if orjson is not None:
+            return orjson.dumps(entry) + b'\n'
+        return json.dumps(entry, separators=(',', ':')).encode('utf-8') + b'\n'
+    
+    def _checkpoint(self):
+        """Push appended rows and metadata lines out to disk"""
+        if isinstance(self.embeddings, np.memmap):
+            self.embeddings.flush()
+        if isinstance(self._scales, np.memmap):
+            self._scales.flush()
+        if self._meta_fp is not None:
+            self._meta_fp.flush()
     
     def _save_memory(self):
-        """Persist embeddings and metadata to disk"""
+        """Persist embeddings, metadata and the search index to disk"""
         try:
-            if self.embeddings:
-                np.save(self.embeddings_file, np.array(self.embeddings))
+            self._checkpoint()
             
-            with open(self.metadata_file, 'w') as f:
-                json.dump(self.metadata, f, indent=2)
+            if self.index is not None:
+                self.faiss.write_index(self.index, str(self.index_file))
             
-            logger.debug(f"Saved {len(self.embeddings)} memories to disk")
+            logger.debug(f"Saved {self._n_used} memories to disk")
         except Exception as e:
             logger.error(f"Failed to save memory: {e}")
     
@@ -111,32 +458,60 @@ class RAGMemory:
             logger.warning("No encoder available, skipping embedding")
             return
         
+        if self._read_only:
+            logger.debug("RAG memory failed to load, skipping embedding")
+            return
+        
         try:
             # Combine user message and response for context
             interaction_text = f"User: {user_message}\nAgent: {agent_response}"
             
             # Generate embedding
-            embedding = self.encoder.encode(interaction_text).tolist()
+            embedding = np.asarray(
+                self.encoder.encode(
+                    [interaction_text],
+                    convert_to_numpy=True,
+                    normalize_embeddings=True
+                ),
+                dtype=np.float32
+            )
             
-            # Store embedding and metadata
-            self.embeddings.append(embedding)
-            self.metadata.append({
+            n_before = self._n_used
+            added = self._store(embedding, [{
                 "user_message": user_message,
                 "agent_response": agent_response,
                 "conversation_id": conversation_id,
                 "timestamp": datetime.now().isoformat(),
                 "metadata": metadata or {}
-            })
+            }])
+            
+            if not added:
+                logger.debug("Skipped near-duplicate interaction")
+                return
             
-            # Auto-save every 10 interactions
-            if len(self.embeddings) % 10 == 0:
-                self._save_memory()
+            # Flush to disk every 10 interactions
+            if self._n_used // 10 != n_before // 10:
+                self._checkpoint()
             
-            logger.debug(f"Added interaction to RAG memory (total: {len(self.embeddings)})")
+            logger.debug(f"Added interaction to RAG memory (total: {self._n_used})")
         
         except Exception as e:
             logger.error(f"Failed to add interaction: {e}")
     
+    def _is_near_duplicate(self, embedding: np.ndarray, batch: List[np.ndarray]) -> bool:
+        """Whether a normalized embedding nearly matches a recent stored row or one earlier in its batch"""
+        if self.dedupe_threshold is None:
+            return False
+        
+        best = -1.0
+        if self._n_used:
+            self._ensure_normalized()
+            recent = self._float_rows(max(0, self._n_used - DEDUPE_WINDOW), self._n_used)
+            best = float((recent @ embedding).max())
+        if batch:
+            best = max(best, float((np.stack(batch[-DEDUPE_WINDOW:]) @ embedding).max()))
+        return best > self.dedupe_threshold
+    
     def search_similar(
         self,
         query: str,
@@ -154,26 +529,17 @@ class RAGMemory:
         Returns:
             List of similar interactions with scores
         """
-        if not self.encoder or not self.embeddings:
+        if not self.encoder or not self._n_used:
             return []
         
         try:
-            # Encode query
-            query_embedding = self.encoder.encode(query)
+            query_embedding = self._encode_query(query)
             
-            # Calculate cosine similarity with all stored embeddings
-            similarities = []
-            for i, emb in enumerate(self.embeddings):
-                similarity = self._cosine_similarity(query_embedding, np.array(emb))
-                if similarity >= threshold:
-                    similarities.append((i, similarity))
+            top_idx, top_scores = self._top_k(query_embedding, top_k, threshold)
             
-            # Sort by similarity (descending)
-            similarities.sort(key=lambda x: x[1], reverse=True)
-            
-            # Return top_k results with metadata
+            # Return top_k results above threshold with metadata
             results = []
-            for idx, score in similarities[:top_k]:
+            for idx, score in zip(top_idx, top_scores):
                 result = self.metadata[idx].copy()
                 result["similarity_score"] = float(score)
                 results.append(result)
@@ -185,9 +551,229 @@ class RAGMemory:
             logger.error(f"Search failed: {e}")
             return []
     
+    def _encode_query(self, text: str) -> np.ndarray:
+        """Encode a search query to a unit-length float32 vector, with LRU caching"""
+        # The normalized text only keys the cache; the query itself is encoded
+        # as given, since cased encoders embed "Sol" and "sol" differently
+        key = text.strip().lower()
+        cached = self._query_cache.get(key)
+        if cached is not None:
+            self._query_cache.move_to_end(key)
+            return cached
+        
+        # Unit length, so cosine is a dot product
+        embedding = np.asarray(
+            self.encoder.encode(text, normalize_embeddings=True),
+            dtype=np.float32
+        )
+        embedding.flags.writeable = False
+        
+        self._query_cache[key] = embedding
+        if len(self._query_cache) > QUERY_CACHE_SIZE:
+            self._query_cache.popitem(last=False)
+        return embedding
+    
+    def _top_k(
+        self,
+        query_embedding: np.ndarray,
+        top_k: int,
+        threshold: float = -np.inf
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the stored rows most similar to a normalized query.
+        
+        Returns:
+            (indices, scores) of at most top_k rows scoring >= threshold,
+            best match first
+        """
+        k = min(top_k, self._n_used)
+        if k <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        
+        self._ensure_normalized()
+        
+        if self.index is not None:
+            scores, idx = self.index.search(query_embedding[None, :], k)
+            found = (idx[0] >= 0) & (scores[0] >= threshold)
+            return idx[0][found], scores[0][found]
+        
+        if self.simsimd is not None:
+            scores = self._simsimd_scores(query_embedding)
+        elif NUMBA_AVAILABLE and _numba_warm and self.storage_dtype == "float32" and self._n_used > NUMBA_MIN_ROWS:
+            scores = _cosine_scores(self._matrix, query_embedding)
+        elif self.storage_dtype != "float32":
+            # Widen a block at a time so the full matrix is never expanded;
+            # accumulation stays in float32
+            scores = np.empty(self._n_used, dtype=np.float32)
+            for start in range(0, self._n_used, SCORE_BLOCK):
+                stop = min(start + SCORE_BLOCK, self._n_used)
+                block = self.embeddings[start:stop].astype(np.float32)
+                scores[start:stop] = block @ query_embedding
+                if self.storage_dtype == "int8":
+                    scores[start:stop] *= self._scales[start:stop]
+        else:
+            # Cosine similarity with all stored embeddings in one matvec
+            scores = self._matrix @ query_embedding
+        
+        # Drop rows under the threshold, then select top_k without sorting everything
+        pool = np.flatnonzero(scores >= threshold)
+        if len(pool) > k:
+            pool = pool[np.argpartition(-scores[pool], k - 1)[:k]]
+        top_idx = pool[np.argsort(-scores[pool])]
+        return top_idx, scores[top_idx]
+    
+    def _simsimd_scores(self, query_embedding: np.ndarray) -> np.ndarray:
+        """Cosine similarity of every stored row with the query via SimSIMD"""
+        query = query_embedding[None, :]
+        if self.storage_dtype == "int8":
+            # Cosine is scale-invariant, so int8 rows compare directly with
+            # an int8 query and the per-row scales drop out
+            query = self._quantize_rows(query)[0]
+        else:
+            query = query.astype(self.embeddings.dtype)
+        distances = self.simsimd.cdist(self._matrix, query, metric="cosine")
+        return 1.0 - np.asarray(distances, dtype=np.float32).ravel()
+    
+    @property
+    def _matrix(self) -> np.ndarray:
+        """Stored (normalized) embeddings, one row per interaction"""
+        return self.embeddings[:self._n_used]
+    
+    def _float_rows(self, start: int, stop: int) -> np.ndarray:
+        """Stored rows start:stop as float32, dequantizing int8 storage"""
+        rows = self.embeddings[start:stop]
+        if self.storage_dtype == "int8":
+            return rows.astype(np.float32) * self._scales[start:stop, None]
+        return rows.astype(np.float32, copy=False)
+    
+    def _store(self, embeddings: np.ndarray, entries: List[Dict]) -> int:
+        """
+        Append normalized embeddings and their metadata as one unit, skipping
+        near-duplicates. Rows are written past _n_used and only counted once
+        their metadata lines and index entries are written too, so a failure
+        leaves the store as it was.
+        
+        Returns:
+            Number of interactions stored
+        """
+        rows, kept = [], []
+        for embedding, entry in zip(embeddings, entries):
+            if self._is_near_duplicate(embedding, rows):
+                continue
+            rows.append(embedding)
+            kept.append(entry)
+        if not rows:
+            return 0
+        
+        rows = np.stack(rows)
+        n_before, n_after = self._n_used, self._n_used + len(rows)
+        self._ensure_normalized()
+        if n_after > len(self.embeddings):
+            # Doubling keeps appends amortized O(1)
+            self._resize_store(max(16, 2 * len(self.embeddings), n_after), rows.shape[1])
+        
+        log_size = None
+        try:
+            if self.storage_dtype == "int8":
+                quantized, scales = self._quantize_rows(rows)
+                self.embeddings[n_before:n_after] = quantized
+                self._scales[n_before:n_after] = scales
+            else:
+                self.embeddings[n_before:n_after] = rows
+            
+            if self._meta_fp is None:
+                self._meta_fp = open(self.metadata_file, 'ab')
+            log_size = self._meta_fp.tell()
+            for entry in kept:
+                self._meta_fp.write(self._dump_line(entry))
+            
+            if self.index is not None:
+                self.index.add(rows)
+        except Exception:
+            # Rows past _n_used are only spare capacity; take back the
+            # metadata lines and any index entries
+            if log_size is not None:
+                self._meta_fp.flush()
+                self._meta_fp.truncate(log_size)
+                self._meta_fp.seek(log_size)
+            if self.index is not None and self.index.ntotal != n_before:
+                self._build_index()
+            raise
+        
+        self.metadata.extend(kept)
+        self._n_used = n_after
+        
+        if self.index is None and self.faiss:
+            try:
+                self._build_index()
+            except Exception as e:
+                logger.error(f"Failed to build Faiss index: {e}")
+        return len(rows)
+    
+    def _resize_store(self, capacity: int, dim: int):
+        """Move the stored rows into new file-backed buffers with room for capacity rows"""
+        self.embeddings = self._remap(
+            self.embeddings_file,
+            (capacity, dim),
+            STORAGE_DTYPES[self.storage_dtype],
+            self._matrix
+        )
+        if self.storage_dtype == "int8":
+            self._scales = self._remap(self.scales_file, (capacity,), np.float32, self._scales[:self._n_used])
+        if self._is_normalized:
+            self.normalized_file.touch()
+    
+    def _ensure_normalized(self):
+        """Normalize rows loaded from an older, unnormalized file (once, in place)"""
+        if self._is_normalized:
+            return
+        
+        rows = self._matrix
+        sq_norms = np.einsum('ij,ij->i', rows, rows, dtype=np.float32)
+        if not np.allclose(sq_norms[sq_norms > 0], 1.0, atol=2e-3):
+            sq_norms[sq_norms == 0] = 1.0
+            rows /= np.sqrt(sq_norms)[:, None]
+            self._checkpoint()
+            logger.info(f"Normalized {self._n_used} stored embeddings")
+        
+        self._is_normalized = True
+        self.normalized_file.touch()
+    
+    @staticmethod
+    def _remap(path: Path, shape: Tuple[int, ...], dtype, rows: np.ndarray) -> np.memmap:
+        """Write rows into a new .npy of the given shape and return it mapped read/write"""
+        tmp_file = path.with_suffix(".npy.tmp")
+        buffer = np.lib.format.open_memmap(tmp_file, mode='w+', dtype=dtype, shape=shape)
+        if len(rows):
+            buffer[:len(rows)] = rows
+        buffer.flush()
+        # The mapping follows the file through the rename
+        os.replace(tmp_file, path)
+        return buffer
+    
+    @staticmethod
+    def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+        """L2-normalize each row (zero rows are left as-is)"""
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+    
+    @staticmethod
+    def _quantize_rows(matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Symmetric per-row int8 quantization; returns (int8 rows, float32 scales)"""
+        matrix = np.asarray(matrix, dtype=np.float32)
+        scales = np.abs(matrix).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        quantized = np.rint(matrix / scales[:, None]).astype(np.int8)
+        return quantized, scales.astype(np.float32)
+    
     def _cosine_similarity(self, a: np.ndarray, b: np.ndarray) -> float:
         """Calculate cosine similarity between two vectors"""
-        return np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b))
+        a = np.ascontiguousarray(a, dtype=np.float32)
+        b = np.ascontiguousarray(b, dtype=np.float32)
+        if self.simsimd is not None:
+            return 1.0 - float(self.simsimd.cosine(a, b))
+        return float(np.dot(a, b) / np.sqrt(np.vdot(a, a) * np.vdot(b, b)))
     
     def get_learning_context(
         self,
@@ -225,24 +811,50 @@ class RAGMemory:
     def get_stats(self) -> Dict:
         """Get memory statistics"""
         return {
-            "total_interactions": len(self.embeddings),
+            "total_interactions": self._n_used,
             "storage_path": str(self.storage_path),
             "embedding_model": self.embedding_model_name,
-            "has_encoder": self.encoder is not None
+            "has_encoder": self.encoder is not None,
+            "onnx_encoder": isinstance(self.encoder, OnnxSentenceEncoder),
+            "storage_dtype": self.storage_dtype,
+            "simd_kernel": self.simsimd is not None,
+            "search_backend": "faiss" if self.index is not None else "numpy",
+            "read_only": self._read_only
         }
     
     def save(self):
         """Force save all memories"""
         self._save_memory()
     
+    def export_metadata(self, path: str):
+        """Write the stored interactions as indented JSON for human inspection"""
+        with open(path, 'w') as f:
+            json.dump(self.metadata, f, indent=2)
+    
     def clear(self):
         """Clear all stored memories"""
-        self.embeddings = []
+        self.embeddings = np.empty((0, 0), dtype=STORAGE_DTYPES[self.storage_dtype])
+        self._scales = np.empty(0, dtype=np.float32)
+        self._n_used = 0
+        self._is_normalized = True
         self.metadata = []
+        self.index = None
+        if self._meta_fp is not None:
+            self._meta_fp.close()
+            self._meta_fp = None
+        if self.legacy_metadata_file.exists():
+            self.legacy_metadata_file.unlink()
         if self.embeddings_file.exists():
             self.embeddings_file.unlink()
+        if self.index_file.exists():
+            self.index_file.unlink()
+        if self.scales_file.exists():
+            self.scales_file.unlink()
+        if self.normalized_file.exists():
+            self.normalized_file.unlink()
         if self.metadata_file.exists():
             self.metadata_file.unlink()
+        self._read_only = False
         logger.info("Cleared all RAG memories")
 
 
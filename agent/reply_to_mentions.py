@@ -10,7 +10,12 @@ import sys
 import time
 import logging
 import random
+import json
+import sqlite3
 import requests
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 from dotenv import load_dotenv
 
@@ -31,6 +36,25 @@ logger = logging.getLogger(__name__)
 OLLAMA_URL = "http://localhost:11434/api/chat"
 MODEL = "llama3.2:1b"
 
+# Stop streaming once the reply is clearly past tweet length
+STREAM_STOP_CHARS = 300
+
+# Keep the model loaded between polls so replies don't pay a reload
+KEEP_ALIVE = "30m"
+
+# Keep-alive connection pool for Ollama calls
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# Generates replies in the background while earlier ones are being posted.
+# Ollama is CPU-bound server-side, so keep this small
+_REPLY_POOL = ThreadPoolExecutor(max_workers=2)
+
+# Replied-to tweet IDs survive restarts here
+REPLIED_DB = "replied_tweets.db"
+REPLIED_MAX_ENTRIES = 10_000
+REPLIED_MAX_AGE = 7 * 24 * 3600
+
 SYSTEM_PROMPT = """You are Pepe. You're literally Pepe the frog, but you ended up in crypto and now you're on Solana. Powered by PLOI.
 
 CORE ESSENCE:
@@ -65,10 +89,77 @@ REPLY RULES:
 - Short replies > long replies"""
 
 
+class RepliedTweets:
+    """
+    Set of tweet IDs already replied to, persisted in sqlite.
+    Keeps at most REPLIED_MAX_ENTRIES IDs, none older than REPLIED_MAX_AGE.
+    """
+    
+    def __init__(self, path: str = REPLIED_DB):
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS replied (tweet_id TEXT PRIMARY KEY, ts INTEGER NOT NULL)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS replied_ts ON replied (ts)")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        )
+        
+        # Oldest first, so eviction pops from the front
+        self._ids = OrderedDict()
+        self._evict_expired(int(time.time()))
+        rows = self.conn.execute(
+            "SELECT tweet_id, ts FROM replied ORDER BY ts DESC LIMIT ?",
+            (REPLIED_MAX_ENTRIES,)
+        ).fetchall()
+        self._ids.update(reversed(rows))
+        
+        # Every mention up to this ID has been handled, so it needn't be fetched again
+        row = self.conn.execute("SELECT value FROM state WHERE key = 'since_id'").fetchone()
+        self.since_id = int(row[0]) if row else None
+    
+    def __contains__(self, tweet_id: str) -> bool:
+        return tweet_id in self._ids
+    
+    def __len__(self) -> int:
+        return len(self._ids)
+    
+    def add(self, tweet_id: str):
+        """Record a reply and drop entries past the size/age limits"""
+        now = int(time.time())
+        self._ids[tweet_id] = now
+        self._ids.move_to_end(tweet_id)
+        while len(self._ids) > REPLIED_MAX_ENTRIES:
+            self._ids.popitem(last=False)
+        
+        self.conn.execute("INSERT OR IGNORE INTO replied (tweet_id, ts) VALUES (?, ?)", (tweet_id, now))
+        self._evict_expired(now)
+    
+    def advance(self, since_id: int):
+        """Move the fetch watermark forward; it never moves back"""
+        if self.since_id is not None and since_id <= self.since_id:
+            return
+        self.since_id = since_id
+        self.conn.execute(
+            "INSERT OR REPLACE INTO state (key, value) VALUES ('since_id', ?)",
+            (str(since_id),)
+        )
+        self.conn.commit()
+    
+    def _evict_expired(self, now: int):
+        """Forget replies older than REPLIED_MAX_AGE"""
+        cutoff = now - REPLIED_MAX_AGE
+        self.conn.execute("DELETE FROM replied WHERE ts < ?", (cutoff,))
+        self.conn.commit()
+        
+        while self._ids and next(iter(self._ids.values())) < cutoff:
+            self._ids.popitem(last=False)
+
+
 def check_ollama():
     """Check if Ollama is running"""
     try:
-        response = requests.get("http://localhost:11434/api/tags", timeout=2)
+        response = _SESSION.get("http://localhost:11434/api/tags", timeout=2)
         return response.status_code == 200
     except:
         return False
@@ -89,18 +180,30 @@ def generate_reply(tweet_text: str, author: str) -> str:
                 {"role": "system", "content": SYSTEM_PROMPT},
                 {"role": "user", "content": prompt}
             ],
-            "stream": False,
+            "stream": True,
+            "keep_alive": KEEP_ALIVE,
             "options": {
                 "temperature": 0.9,
                 "top_p": 0.95
             }
         }
         
-        response = requests.post(OLLAMA_URL, json=payload, timeout=30)
-        response.raise_for_status()
+        # Read tokens as they arrive and hang up once there's enough for a tweet
+        parts = []
+        length = 0
+        with _SESSION.post(OLLAMA_URL, json=payload, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                piece = chunk.get("message", {}).get("content", "")
+                parts.append(piece)
+                length += len(piece)
+                if chunk.get("done") or length >= STREAM_STOP_CHARS:
+                    break
         
-        result = response.json()
-        content = result["message"]["content"].strip()
+        content = "".join(parts).strip()
         
         # Remove quotes if model added them
         if content.startswith('"') and content.endswith('"'):
@@ -119,8 +222,31 @@ def generate_reply(tweet_text: str, author: str) -> str:
         return None
 
 
+def warmup_model():
+    """
+    Load the model and process SYSTEM_PROMPT once at startup.
+    Replies send the same system message byte-for-byte, so Ollama can
+    reuse the cached prompt prefix instead of re-evaluating it.
+    """
+    try:
+        payload = {
+            "model": MODEL,
+            "messages": [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": "gm"}
+            ],
+            "stream": False,
+            "keep_alive": KEEP_ALIVE,
+            "options": {"num_predict": 1}
+        }
+        _SESSION.post(OLLAMA_URL, json=payload, timeout=120).raise_for_status()
+        logger.info("✅ Model warmed up")
+    except Exception as e:
+        logger.warning(f"Model warmup failed: {e}")
+
+
 def setup_twitter():
-    """Setup Twitter API client"""
+    """Setup Twitter API client, returning it with our user ID"""
     try:
         import tweepy
         
@@ -132,7 +258,7 @@ def setup_twitter():
         
         if not all([api_key, api_secret, access_token, access_secret]):
             logger.error("Twitter credentials missing in .env")
-            return None
+            return None, None
         
         # API v2 client
         client = tweepy.Client(
@@ -143,30 +269,32 @@ def setup_twitter():
             access_token_secret=access_secret
         )
         
-        # Test connection
+        # Test connection; our user ID never changes, so keep it from here
         me = client.get_me()
         logger.info(f"Connected as: @{me.data.username}")
         
-        return client
+        return client, me.data.id
         
     except Exception as e:
         logger.error(f"Twitter setup failed: {e}")
-        return None
+        return None, None
 
 
-def get_mentions(client, replied_tweets: set):
+def get_mentions(client, my_id, replied_tweets: RepliedTweets):
     """Get mentions and reply to them"""
     try:
-        # Get authenticated user
-        me = client.get_me()
-        my_id = me.data.id
+        # Only ask for mentions newer than the ones already handled
+        since = {}
+        if replied_tweets.since_id is not None:
+            since["since_id"] = replied_tweets.since_id
         
         # Get mentions using v2 endpoint (this should work on Free tier)
         mentions = client.get_users_mentions(
             id=my_id,
             max_results=10,
             tweet_fields=['created_at', 'author_id', 'conversation_id'],
-            expansions=['author_id']
+            expansions=['author_id'],
+            **since
         )
         
         if not mentions.data:
@@ -179,7 +307,8 @@ def get_mentions(client, replied_tweets: set):
             for user in mentions.includes['users']:
                 users_dict[user.id] = user.username
         
-        new_replies = 0
+        # Start generating replies for every new mention up front
+        pending = {}
         for mention in mentions.data:
             tweet_id = str(mention.id)
             
@@ -194,11 +323,23 @@ def get_mentions(client, replied_tweets: set):
             tweet_text = mention.text
             logger.info(f"📨 Mention from @{author}: {tweet_text[:60]}...")
             
-            # Generate reply
-            reply = generate_reply(tweet_text, author)
+            future = _REPLY_POOL.submit(generate_reply, tweet_text, author)
+            pending[future] = (tweet_id, author)
+        
+        # Post each reply as soon as it's ready; the next ones keep generating
+        new_replies = 0
+        posted_any = False
+        for future in as_completed(pending):
+            tweet_id, author = pending[future]
+            reply = future.result()
             
             if reply:
                 try:
+                    # Rate limiting between posts
+                    if posted_any:
+                        time.sleep(random.uniform(3, 8))
+                    posted_any = True
+                    
                     # Post reply
                     client.create_tweet(
                         text=reply,
@@ -208,14 +349,19 @@ def get_mentions(client, replied_tweets: set):
                     replied_tweets.add(tweet_id)
                     new_replies += 1
                     
-                    # Rate limiting
-                    time.sleep(random.uniform(3, 8))
-                    
                 except Exception as e:
                     logger.error(f"Failed to post reply: {e}")
             else:
                 logger.warning("Failed to generate reply")
         
+        # Replies post out of order, so stop the watermark just below the
+        # oldest mention that failed; it gets fetched and retried next time
+        failed_ids = [int(tweet_id) for tweet_id, _ in pending.values() if tweet_id not in replied_tweets]
+        if failed_ids:
+            replied_tweets.advance(min(failed_ids) - 1)
+        else:
+            replied_tweets.advance(max(int(mention.id) for mention in mentions.data))
+        
         if new_replies > 0:
             logger.info(f"Replied to {new_replies} new mentions")
         
@@ -241,9 +387,10 @@ def main():
         return
     
     logger.info("✅ Ollama is running")
+    warmup_model()
     
     # Setup Twitter
-    client = setup_twitter()
+    client, my_id = setup_twitter()
     if not client:
         logger.error("❌ Twitter setup failed")
         return
@@ -258,12 +405,13 @@ def main():
     logger.info("  - Press Ctrl+C to stop")
     logger.info("")
     
-    replied_tweets = set()
+    replied_tweets = RepliedTweets()
+    logger.info(f"Loaded {len(replied_tweets)} previously replied mentions")
     
     try:
         while True:
             logger.info("🔍 Checking for new mentions...")
-            replied_tweets = get_mentions(client, replied_tweets)
+            replied_tweets = get_mentions(client, my_id, replied_tweets)
             
             # Wait 2 minutes before checking again
             wait_time = random.uniform(120, 180)
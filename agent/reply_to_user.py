@@ -9,7 +9,9 @@ import sys
 import time
 import logging
 import random
+import json
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 from dotenv import load_dotenv
 
@@ -30,6 +32,16 @@ logger = logging.getLogger(__name__)
 OLLAMA_URL = "http://localhost:11434/api/chat"
 MODEL = "llama3.2:1b"
 
+# Stop streaming once the reply is clearly past tweet length
+STREAM_STOP_CHARS = 300
+
+# Keep the model loaded between polls so replies don't pay a reload
+KEEP_ALIVE = "30m"
+
+# Keep-alive connection pool for Ollama calls
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
 # Target user
 TARGET_USERNAME = "omedia_jyu"
 
@@ -71,7 +83,7 @@ REPLY RULES:
 def check_ollama():
     """Check if Ollama is running"""
     try:
-        response = requests.get("http://localhost:11434/api/tags", timeout=2)
+        response = _SESSION.get("http://localhost:11434/api/tags", timeout=2)
         return response.status_code == 200
     except:
         return False
@@ -88,18 +100,30 @@ def generate_reply(tweet_text: str) -> str:
                 {"role": "system", "content": SYSTEM_PROMPT},
                 {"role": "user", "content": prompt}
             ],
-            "stream": False,
+            "stream": True,
+            "keep_alive": KEEP_ALIVE,
             "options": {
                 "temperature": 0.9,
                 "top_p": 0.95
             }
         }
         
-        response = requests.post(OLLAMA_URL, json=payload, timeout=30)
-        response.raise_for_status()
+        # Read tokens as they arrive and hang up once there's enough for a tweet
+        parts = []
+        length = 0
+        with _SESSION.post(OLLAMA_URL, json=payload, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                piece = chunk.get("message", {}).get("content", "")
+                parts.append(piece)
+                length += len(piece)
+                if chunk.get("done") or length >= STREAM_STOP_CHARS:
+                    break
         
-        result = response.json()
-        content = result["message"]["content"].strip()
+        content = "".join(parts).strip()
         
         # Remove quotes if model added them
         if content.startswith('"') and content.endswith('"'):
@@ -118,6 +142,29 @@ def generate_reply(tweet_text: str) -> str:
         return None
 
 
+def warmup_model():
+    """
+    Load the model and process SYSTEM_PROMPT once at startup.
+    Replies send the same system message byte-for-byte, so Ollama can
+    reuse the cached prompt prefix instead of re-evaluating it.
+    """
+    try:
+        payload = {
+            "model": MODEL,
+            "messages": [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": "gm"}
+            ],
+            "stream": False,
+            "keep_alive": KEEP_ALIVE,
+            "options": {"num_predict": 1}
+        }
+        _SESSION.post(OLLAMA_URL, json=payload, timeout=120).raise_for_status()
+        logger.info("✅ Model warmed up")
+    except Exception as e:
+        logger.warning(f"Model warmup failed: {e}")
+
+
 def setup_twitter():
     """Setup Twitter API client"""
     try:
@@ -245,6 +292,7 @@ def main():
         return
     
     logger.info("✅ Ollama is running")
+    warmup_model()
     
     # Setup Twitter
     client = setup_twitter()
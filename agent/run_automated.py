@@ -8,14 +8,17 @@ Run PLOI Pepe with full automation
 
 import os
 import sys
+import random
 import asyncio
 import logging
+from collections import deque
 from dotenv import load_dotenv
 
 # Import agent components
 from orchestrator import Orchestrator
 from platforms import TwitterAdapter
 from memory import MemoryStore
+from tweet_text import fit_to_tweet
 
 # Load environment
 load_dotenv()
@@ -31,29 +34,45 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Prompts for autonomous tweets
+_GEN_PROMPTS = (
+    "generate a degen crypto tweet",
+    "say something about memecoins",
+    "share your thoughts on solana",
+    "make a joke about defi",
+    "post about pump.fun",
+    "comment on the current market"
+)
+
+# Tweets are generated a batch at a time and posted one per run
+TWEET_POOL_SIZE = 4
+_TWEET_POOL = deque()
+
+
+async def refill_tweet_pool(agent):
+    """Generate the next batch of autonomous tweets in one go"""
+    prompts = [random.choice(_GEN_PROMPTS) for _ in range(TWEET_POOL_SIZE)]
+    responses = await agent.generate_batch_async(prompts)
+    _TWEET_POOL.extend(fit_to_tweet(response) for response in responses if response)
+
 
 async def generate_tweet(agent) -> str:
-    """Generate an autonomous tweet"""
-    prompts = [
-        "generate a degen crypto tweet",
-        "say something about memecoins",
-        "share your thoughts on solana",
-        "make a joke about defi",
-        "post about pump.fun",
-        "comment on the current market"
-    ]
-    
-    import random
-    prompt = random.choice(prompts)
-    
-    response = await agent.generate_async(prompt)
-    return response[:280]  # Twitter character limit
+    """Take the next autonomous tweet, generating a new batch when the pool is empty"""
+    if not _TWEET_POOL:
+        await refill_tweet_pool(agent)
+    if not _TWEET_POOL:
+        # Every response in the batch came back empty
+        logger.warning("No tweets generated this time")
+        return None
+    return _TWEET_POOL.popleft()
 
 
 async def auto_post_task(twitter_adapter, agent):
     """Autonomous posting task"""
     try:
         tweet = await generate_tweet(agent)
+        if not tweet:
+            return
         await twitter_adapter.send_message("timeline", tweet)
         logger.info(f"Auto-posted: {tweet}")
     except Exception as e:
@@ -72,7 +91,7 @@ async def check_mentions_task(twitter_adapter, agent):
             # Post reply
             await twitter_adapter.send_message(
                 mention['id'],
-                response[:280],
+                fit_to_tweet(response),
                 reply_to=mention['id']
             )
             logger.info(f"Replied to @{mention['username']}")
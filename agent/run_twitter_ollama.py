@@ -11,10 +11,15 @@ import asyncio
 import logging
 import random
 import requests
+import aiohttp
+from requests.adapters import HTTPAdapter
 import json
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 
+from tweet_text import fit_to_tweet
+
 load_dotenv()
 
 # Setup logging
@@ -30,7 +35,46 @@ logger = logging.getLogger(__name__)
 
 # Ollama settings
 OLLAMA_URL = "http://localhost:11434/api/chat"
-MODEL = "llama3.2:1b"
+MODEL = "llama3.2:1b-instruct-q4_K_M"
+
+# A tweet prompt plus reply fits well inside 512 tokens, so keep the KV cache small
+MODEL_OPTIONS = {"num_ctx": 512, "num_batch": 128}
+
+# Keep the model loaded for good; every request resets Ollama's unload timer
+KEEP_ALIVE = -1
+
+# Longest tweet we post; streaming stops once the model has written past it
+MAX_TWEET_CHARS = 280
+
+# Keep-alive connection pool for Ollama calls
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+_SESSION.headers["Connection"] = "keep-alive"
+
+# Mention replies in flight at once
+MAX_CONCURRENT_REPLIES = 4
+
+# Identical mention prompts within the same hour share one generated reply;
+# each entry is (generation task, authors already given that reply)
+REPLY_CACHE_SIZE = 512
+REPLY_CACHE_SECONDS = 3600
+_REPLY_CACHE = OrderedDict()
+
+# Where the newest handled mention ID is kept between restarts
+STATE_PATH = "./data/twitter_state.json"
+
+# Prompts for autonomous tweets
+_AUTO_PROMPTS = (
+    "say something chill about solana",
+    "share a quick thought on memecoins",
+    "comment casually on the crypto market",
+    "make a relaxed observation about trading",
+    "say something about pump.fun in your style",
+    "share how you're feeling about sol today",
+    "make a simple comment about defi",
+    "say gm in your own way",
+    "share a brief crypto thought"
+)
 
 SYSTEM_PROMPT = """You are Pepe. You're literally Pepe the frog, but you ended up in crypto and now you're on Solana. Powered by PLOI.
 
@@ -67,13 +111,32 @@ TWITTER RULES:
 def check_ollama():
     """Check if Ollama is running"""
     try:
-        response = requests.get("http://localhost:11434/api/tags", timeout=2)
+        response = _SESSION.get("http://localhost:11434/api/tags", timeout=2)
         return response.status_code == 200
     except:
         return False
 
 
-def generate_with_ollama(prompt: str, system: str = SYSTEM_PROMPT) -> str:
+def warmup_model():
+    """Load the model into memory once at startup so the first tweet doesn't pay for it"""
+    try:
+        payload = {
+            "model": MODEL,
+            "messages": [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": "hi"}
+            ],
+            "stream": False,
+            "keep_alive": KEEP_ALIVE,
+            "options": {**MODEL_OPTIONS, "num_predict": 1}
+        }
+        _SESSION.post(OLLAMA_URL, json=payload, timeout=120).raise_for_status()
+        logger.info("✅ Model loaded")
+    except Exception as e:
+        logger.warning(f"Model warmup failed: {e}")
+
+
+async def generate_with_ollama(session: aiohttp.ClientSession, prompt: str, system: str = SYSTEM_PROMPT) -> str:
     """Generate response using Ollama"""
     try:
         payload = {
@@ -82,22 +145,43 @@ def generate_with_ollama(prompt: str, system: str = SYSTEM_PROMPT) -> str:
                 {"role": "system", "content": system},
                 {"role": "user", "content": prompt}
             ],
-            "stream": False,
+            "stream": True,
+            "keep_alive": KEEP_ALIVE,
             "options": {
+                **MODEL_OPTIONS,
                 "temperature": 0.9,
-                "top_p": 0.95
+                "top_p": 0.95,
+                "num_predict": 80
             }
         }
         
-        response = requests.post(OLLAMA_URL, json=payload, timeout=30)
-        response.raise_for_status()
+        # Read tokens as they arrive and hang up once there's more than a tweet
+        parts = []
+        length = 0
+        async with session.post(
+            OLLAMA_URL,
+            json=payload,
+            timeout=aiohttp.ClientTimeout(total=30)
+        ) as response:
+            response.raise_for_status()
+            async for line in response.content:
+                if not line.strip():
+                    continue
+                chunk = json.loads(line)
+                piece = chunk.get("message", {}).get("content", "")
+                parts.append(piece)
+                length += len(piece)
+                if chunk.get("done"):
+                    break
+                if length > MAX_TWEET_CHARS:
+                    # Drop the connection so Ollama stops generating
+                    response.close()
+                    break
         
-        result = response.json()
-        content = result["message"]["content"].strip()
+        content = "".join(parts).strip()
         
-        # Ensure under 280 characters
-        if len(content) > 280:
-            content = content[:277] + "..."
+        # Ensure under 280 characters as Twitter counts them
+        content = fit_to_tweet(content, MAX_TWEET_CHARS)
         
         return content
         
@@ -106,8 +190,42 @@ def generate_with_ollama(prompt: str, system: str = SYSTEM_PROMPT) -> str:
         return None
 
 
+async def generate_reply(session: aiohttp.ClientSession, prompt: str, author: str = None) -> str:
+    """
+    Generate a mention reply, reusing the one for an identical prompt this hour.
+    Twitter rejects duplicate tweets, so a reused reply is addressed to its
+    author, and an author who already got it gets a freshly generated one.
+    """
+    key = (prompt, int(time.time()) // REPLY_CACHE_SECONDS)
+    entry = _REPLY_CACHE.get(key)
+    
+    if entry is None:
+        # Cache the task itself so duplicates arriving together share one generation
+        task = asyncio.ensure_future(generate_with_ollama(session, prompt))
+        _REPLY_CACHE[key] = (task, {author})
+        if len(_REPLY_CACHE) > REPLY_CACHE_SIZE:
+            _REPLY_CACHE.popitem(last=False)
+        reused = False
+    else:
+        task, authors = entry
+        if not author or author in authors:
+            return await generate_with_ollama(session, prompt)
+        authors.add(author)
+        _REPLY_CACHE.move_to_end(key)
+        reused = True
+    
+    reply = await task
+    if reply is None:
+        # Don't keep failures around
+        _REPLY_CACHE.pop(key, None)
+        return None
+    if reused:
+        reply = fit_to_tweet(f"@{author} {reply}", MAX_TWEET_CHARS)
+    return reply
+
+
 def setup_twitter():
-    """Setup Twitter API client"""
+    """Setup Twitter API client, returning it with our user ID"""
     try:
         import tweepy
         
@@ -118,7 +236,7 @@ def setup_twitter():
         
         if not all([api_key, api_secret, access_token, access_secret]):
             logger.error("Twitter credentials missing in .env")
-            return None
+            return None, None
         
         # OAuth 1.0a
         auth = tweepy.OAuth1UserHandler(
@@ -130,44 +248,31 @@ def setup_twitter():
             consumer_key=api_key,
             consumer_secret=api_secret,
             access_token=access_token,
-            access_token_secret=access_secret
+            access_token_secret=access_secret,
+            # Sleep until the reset time only when Twitter says we're out of quota
+            wait_on_rate_limit=True
         )
         
-        # Test connection
+        # Test connection; our user ID never changes, so keep it from here
         me = client.get_me()
         logger.info(f"Connected to Twitter as: @{me.data.username}")
         
-        return client
+        return client, me.data.id
         
     except Exception as e:
         logger.error(f"Twitter setup failed: {e}")
-        return None
+        return None, None
 
 
-def generate_autonomous_tweet() -> str:
+async def generate_autonomous_tweet(session: aiohttp.ClientSession) -> str:
     """Generate a tweet autonomously"""
-    prompts = [
-        "say something chill about solana",
-        "share a quick thought on memecoins", 
-        "comment casually on the crypto market",
-        "make a relaxed observation about trading",
-        "say something about pump.fun in your style",
-        "share how you're feeling about sol today",
-        "make a simple comment about defi",
-        "say gm in your own way",
-        "share a brief crypto thought"
-    ]
-    
-    prompt = random.choice(prompts)
-    tweet = generate_with_ollama(prompt)
-    
-    return tweet
+    return await generate_with_ollama(session, random.choice(_AUTO_PROMPTS))
 
 
-def post_tweet(client, text: str) -> bool:
+async def post_tweet(client, text: str) -> bool:
     """Post a tweet"""
     try:
-        response = client.create_tweet(text=text)
+        response = await asyncio.to_thread(client.create_tweet, text=text)
         logger.info(f"✅ Posted: {text}")
         return True
     except Exception as e:
@@ -175,44 +280,61 @@ def post_tweet(client, text: str) -> bool:
         return False
 
 
-def check_and_reply_to_mentions(client, last_mention_id=None):
-    """Check mentions and reply"""
-    try:
-        me = client.get_me()
-        my_id = me.data.id
+async def reply_to_mention(client, session: aiohttp.ClientSession, mention, author, limiter: asyncio.Semaphore):
+    """Generate and post a reply to one mention"""
+    async with limiter:
+        logger.info(f"📨 Mention: {mention.text[:50]}...")
+        
+        # Generate reply
+        reply_prompt = f"Reply to this tweet (keep it short and chill): {mention.text}"
+        reply = await generate_reply(session, reply_prompt, author)
         
+        if reply:
+            # Post reply
+            try:
+                await asyncio.to_thread(
+                    client.create_tweet,
+                    text=reply,
+                    in_reply_to_tweet_id=mention.id
+                )
+                logger.info(f"✅ Replied: {reply}")
+            except Exception as e:
+                logger.error(f"Failed to reply: {e}")
+
+
+async def check_and_reply_to_mentions(client, session: aiohttp.ClientSession, my_id, last_mention_id=None):
+    """Check mentions and reply to them concurrently"""
+    try:
         # Get mentions
-        mentions = client.get_users_mentions(
+        mentions = await asyncio.to_thread(
+            client.get_users_mentions,
             id=my_id,
             since_id=last_mention_id,
-            max_results=10
+            max_results=10,
+            expansions=['author_id']
         )
         
         if not mentions.data:
             return last_mention_id
         
-        for mention in mentions.data:
-            mention_id = mention.id
-            mention_text = mention.text
-            
-            logger.info(f"📨 Mention: {mention_text[:50]}...")
-            
-            # Generate reply
-            reply_prompt = f"Reply to this tweet (keep it short and chill): {mention_text}"
-            reply = generate_with_ollama(reply_prompt)
-            
-            if reply:
-                # Post reply
-                try:
-                    client.create_tweet(
-                        text=reply,
-                        in_reply_to_tweet_id=mention_id
-                    )
-                    logger.info(f"✅ Replied: {reply}")
-                except Exception as e:
-                    logger.error(f"Failed to reply: {e}")
-            
-            time.sleep(2)  # Rate limiting
+        # Usernames of the mention authors
+        users = {}
+        if mentions.includes and 'users' in mentions.includes:
+            for user in mentions.includes['users']:
+                users[user.id] = user.username
+        
+        # Generation for one mention overlaps posting of another
+        limiter = asyncio.Semaphore(MAX_CONCURRENT_REPLIES)
+        results = await asyncio.gather(
+            *(
+                reply_to_mention(client, session, mention, users.get(mention.author_id), limiter)
+                for mention in mentions.data
+            ),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Reply failed: {result}")
         
         # Return latest mention ID
         return mentions.data[0].id if mentions.data else last_mention_id
@@ -222,6 +344,67 @@ def check_and_reply_to_mentions(client, last_mention_id=None):
         return last_mention_id
 
 
+def load_last_mention_id():
+    """Newest mention handled before the last shutdown, if known"""
+    try:
+        with open(STATE_PATH) as f:
+            return json.load(f).get("last_mention_id")
+    except Exception:
+        return None
+
+
+def save_last_mention_id(mention_id):
+    """Write the newest handled mention ID so a restart carries on from it"""
+    try:
+        os.makedirs(os.path.dirname(STATE_PATH), exist_ok=True)
+        tmp_path = STATE_PATH + ".tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({"last_mention_id": mention_id}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        # Readers see either the old file or the new one, never half of one
+        os.replace(tmp_path, STATE_PATH)
+    except Exception as e:
+        logger.error(f"Failed to save state: {e}")
+
+
+async def run(client, my_id, last_mention_id=None):
+    """Post and reply on a 5 minute cycle"""
+    last_post_time = datetime.now()
+    post_interval = 3600  # 1 hour base
+    
+    async with aiohttp.ClientSession() as session:
+        while True:
+            # Check mentions every 5 minutes
+            logger.info("🔍 Checking mentions...")
+            newest_mention_id = await check_and_reply_to_mentions(client, session, my_id, last_mention_id)
+            if newest_mention_id != last_mention_id:
+                last_mention_id = newest_mention_id
+                save_last_mention_id(last_mention_id)
+            
+            # Post autonomously with variance
+            time_since_post = (datetime.now() - last_post_time).total_seconds()
+            random_variance = random.uniform(0.8, 1.5)  # ±20-50% variance
+            next_post_in = post_interval * random_variance
+            
+            if time_since_post >= next_post_in:
+                logger.info("📝 Generating autonomous tweet...")
+                tweet = await generate_autonomous_tweet(session)
+                
+                if tweet:
+                    if await post_tweet(client, tweet):
+                        last_post_time = datetime.now()
+                else:
+                    logger.warning("Failed to generate tweet")
+            else:
+                remaining = int(next_post_in - time_since_post)
+                logger.info(f"⏰ Next post in ~{remaining//60} minutes")
+            
+            # Wait 5 minutes
+            logger.info("💤 Sleeping for 5 minutes...\n")
+            await asyncio.sleep(300)
+
+
 def main():
     """Main bot loop"""
     logger.info("="*60)
@@ -236,14 +419,21 @@ def main():
         return
     
     logger.info("✅ Ollama is running")
+    logger.info(f"🧠 Model: {MODEL} (pull it first with: ollama pull {MODEL})")
+    warmup_model()
     
     # Setup Twitter
-    client = setup_twitter()
+    client, my_id = setup_twitter()
     if not client:
         logger.error("❌ Twitter setup failed")
         return
     
     logger.info("✅ Twitter connected")
+    
+    # Pick up where the last run left off
+    last_mention_id = load_last_mention_id()
+    if last_mention_id:
+        logger.info(f"📌 Resuming after mention {last_mention_id}")
     logger.info("")
     logger.info("🤖 Bot is now running autonomously:")
     logger.info("  - Posts every 1-2 hours")
@@ -251,38 +441,8 @@ def main():
     logger.info("  - Press Ctrl+C to stop")
     logger.info("")
     
-    last_post_time = datetime.now()
-    last_mention_id = None
-    post_interval = 3600  # 1 hour base
-    
     try:
-        while True:
-            # Check mentions every 5 minutes
-            logger.info("🔍 Checking mentions...")
-            last_mention_id = check_and_reply_to_mentions(client, last_mention_id)
-            
-            # Post autonomously with variance
-            time_since_post = (datetime.now() - last_post_time).total_seconds()
-            random_variance = random.uniform(0.8, 1.5)  # ±20-50% variance
-            next_post_in = post_interval * random_variance
-            
-            if time_since_post >= next_post_in:
-                logger.info("📝 Generating autonomous tweet...")
-                tweet = generate_autonomous_tweet()
-                
-                if tweet:
-                    if post_tweet(client, tweet):
-                        last_post_time = datetime.now()
-                else:
-                    logger.warning("Failed to generate tweet")
-            else:
-                remaining = int(next_post_in - time_since_post)
-                logger.info(f"⏰ Next post in ~{remaining//60} minutes")
-            
-            # Wait 5 minutes
-            logger.info("💤 Sleeping for 5 minutes...\n")
-            time.sleep(300)
-            
+        asyncio.run(run(client, my_id, last_mention_id))
     except KeyboardInterrupt:
         logger.info("\n👋 Shutting down bot...")
         logger.info("Goodbye!")
@@ -5,7 +5,8 @@ Demonstrates the /deploy command functionality
 """
 
 import sys
-sys.path.insert(0, '/Users/zach/ploi pepe/agent')
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent))
 
 from wallet import SolanaWallet
 from pumpfun import PumpFunDeployer, deploy_token_command
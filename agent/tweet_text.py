@@ -0,0 +1,102 @@
+"""
+Tweet Length Helpers
+Measures and trims text the way Twitter counts it
+"""
+
+import unicodedata
+from typing import List
+
+TWEET_LIMIT = 280
+
+# Code points Twitter counts as 1; everything else (CJK, emoji, ...) counts as 2
+_LIGHT_RANGES = (
+    (0x0000, 0x10FF),
+    (0x2000, 0x200D),
+    (0x2010, 0x201F),
+    (0x2032, 0x2037),
+)
+
+_ZWJ = "\u200d"
+
+
+def _char_weight(char: str) -> int:
+    """Twitter weight of one code point"""
+    cp = ord(char)
+    for start, end in _LIGHT_RANGES:
+        if start <= cp <= end:
+            return 1
+    return 2
+
+
+def _extends_cluster(char: str) -> bool:
+    """Whether a code point attaches to the character before it"""
+    cp = ord(char)
+    return (
+        unicodedata.category(char) in ("Mn", "Me")
+        or char == _ZWJ
+        or 0xFE00 <= cp <= 0xFE0F  # variation selectors
+        or 0x1F3FB <= cp <= 0x1F3FF  # skin tones
+        or 0xE0020 <= cp <= 0xE007F  # flag tags
+    )
+
+
+def _is_regional_indicator(char: str) -> bool:
+    return 0x1F1E6 <= ord(char) <= 0x1F1FF
+
+
+def _clusters(text: str) -> List[str]:
+    """Split text into user-perceived characters (emoji sequences, accented letters, flags)"""
+    clusters = []
+    for char in text:
+        if clusters:
+            last = clusters[-1]
+            if (
+                _extends_cluster(char)
+                or last[-1] == _ZWJ
+                or (_is_regional_indicator(char) and len(last) == 1 and _is_regional_indicator(last))
+            ):
+                clusters[-1] = last + char
+                continue
+        clusters.append(char)
+    return clusters
+
+
+def _cluster_weight(cluster: str) -> int:
+    """Twitter weight of one user-perceived character"""
+    # Emoji count as 2 however many code points make them up
+    if len(cluster) > 1 and any(ord(c) > 0xFFFF or c == "\ufe0f" for c in cluster):
+        return 2
+    return sum(_char_weight(c) for c in cluster)
+
+
+def tweet_weight(text: str) -> int:
+    """Length of text as Twitter counts it"""
+    return sum(_cluster_weight(cluster) for cluster in _clusters(text))
+
+
+def fit_to_tweet(text: str, limit: int = TWEET_LIMIT) -> str:
+    """
+    Trim text to fit in a tweet.
+    Never splits an emoji or accented character, backs off to the last word
+    break when one is reasonably close, and marks the cut with "...".
+    """
+    clusters = _clusters(text)
+    if sum(_cluster_weight(cluster) for cluster in clusters) <= limit:
+        return text
+    
+    budget = limit - 3
+    kept = []
+    for cluster in clusters:
+        budget -= _cluster_weight(cluster)
+        if budget < 0:
+            break
+        kept.append(cluster)
+    
+    trimmed = "".join(kept)
+    
+    # Prefer ending on a whole word unless that throws away too much
+    word_break = trimmed.rfind(" ")
+    if word_break > len(trimmed) // 2:
+        trimmed = trimmed[:word_break]
+    
+    return trimmed.rstrip() + "..."
@@ -5,12 +5,46 @@ Agent-controlled wallet for autonomous transactions
 
 import os
 import json
+import time
 import logging
+import threading
 from typing import Optional, Dict
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Solana dependencies are imported once here rather than on every call
+try:
+    import base58
+    from solders.keypair import Keypair
+    from solders.pubkey import Pubkey
+    from solders.system_program import TransferParams, transfer
+    from solana.rpc.api import Client
+    from solana.rpc.commitment import Confirmed
+    SOLANA_AVAILABLE = True
+except ImportError:
+    # Modules that only optionally use a wallet can still import this one
+    SOLANA_AVAILABLE = False
+
+# Only transfers need the legacy Transaction class, which newer solana-py
+# releases dropped; balances and airdrops work without it
+try:
+    from solana.transaction import Transaction
+except ImportError:
+    Transaction = None
+
+# Blockhashes stay valid for ~150 slots (~60s); refresh well inside that and
+# stop trusting the cache if the refresher falls behind
+BLOCKHASH_REFRESH_SECONDS = 2
+BLOCKHASH_MAX_AGE = 30
+# A new blockhash appears about once a slot (~0.4s); wait this many slots
+# for one before reusing the last transfer's
+BLOCKHASH_REUSE_POLLS = 5
+BLOCKHASH_POLL_SECONDS = 0.4
+
+# The refresher only runs while transfers are being sent
+BLOCKHASH_IDLE_SECONDS = 120
+
 
 class SolanaWallet:
     """
@@ -35,13 +69,7 @@ class SolanaWallet:
         self.network = network
         self.max_sol_per_tx = max_sol_per_tx
         
-        # Import Solana libraries
-        try:
-            from solders.keypair import Keypair
-            from solders.pubkey import Pubkey
-            from solana.rpc.api import Client
-            import base58
-        except ImportError:
+        if not SOLANA_AVAILABLE:
             raise ImportError(
                 "Solana dependencies not installed. Run:\n"
                 "pip install solana solders base58"
@@ -71,8 +99,72 @@ class SolanaWallet:
             "mainnet-beta": "https://api.mainnet-beta.solana.com"
         }
         
+        # The client keeps one pooled HTTP connection to the RPC node
         self.client = Client(rpc_urls[network])
         logger.info(f"Connected to Solana {network}")
+        
+        # Keep a recent blockhash on hand so back-to-back transfers skip that
+        # round trip; the refresher starts with the first transfer
+        self._cached_blockhash = None
+        self._blockhash_time = 0.0
+        self._last_send = 0.0
+        # Two identical transfers signed over the same blockhash get the same
+        # signature and the second is dropped, so each transfer takes a new one
+        self._last_used_blockhash = None
+        self._blockhash_lock = threading.Lock()
+        self._refresher = None
+        self._refresher_lock = threading.Lock()
+        self._stop_refresh = threading.Event()
+    
+    def _start_refresher(self):
+        """Start the blockhash refresher if it isn't already running"""
+        with self._refresher_lock:
+            self._last_send = time.monotonic()
+            if self._refresher is None:
+                self._stop_refresh.clear()
+                self._refresher = threading.Thread(target=self._refresh_blockhash, daemon=True)
+                self._refresher.start()
+    
+    def _refresh_blockhash(self):
+        """Background loop keeping the latest blockhash cached until transfers go idle"""
+        while not self._stop_refresh.wait(BLOCKHASH_REFRESH_SECONDS):
+            with self._refresher_lock:
+                if time.monotonic() - self._last_send > BLOCKHASH_IDLE_SECONDS:
+                    self._refresher = None
+                    return
+            try:
+                blockhash = self.client.get_latest_blockhash().value.blockhash
+                self._cached_blockhash, self._blockhash_time = blockhash, time.monotonic()
+            except Exception as e:
+                logger.warning(f"Blockhash refresh failed: {e}")
+        
+        with self._refresher_lock:
+            self._refresher = None
+    
+    def close(self):
+        """Stop the blockhash refresher"""
+        self._stop_refresh.set()
+    
+    def _recent_blockhash(self):
+        """Claim a recent blockhash the previous transfer didn't use: the cached one if fresh, otherwise fetch"""
+        with self._blockhash_lock:
+            blockhash = self._cached_blockhash
+            if not blockhash or time.monotonic() - self._blockhash_time >= BLOCKHASH_MAX_AGE:
+                blockhash = self.client.get_latest_blockhash().value.blockhash
+            
+            for _ in range(BLOCKHASH_REUSE_POLLS):
+                if blockhash != self._last_used_blockhash:
+                    break
+                time.sleep(BLOCKHASH_POLL_SECONDS)
+                blockhash = self.client.get_latest_blockhash().value.blockhash
+            else:
+                if blockhash == self._last_used_blockhash:
+                    logger.warning("No new blockhash yet, reusing the previous transfer's")
+            
+            if blockhash != self._cached_blockhash:
+                self._cached_blockhash, self._blockhash_time = blockhash, time.monotonic()
+            self._last_used_blockhash = blockhash
+            return blockhash
     
     @property
     def address(self) -> str:
@@ -82,7 +174,6 @@ class SolanaWallet:
     @property
     def private_key_b58(self) -> str:
         """Get base58 encoded private key"""
-        import base58
         return base58.b58encode(bytes(self.keypair)).decode()
     
     def get_balance(self) -> float:
@@ -112,8 +203,6 @@ class SolanaWallet:
             return False
         
         try:
-            from solana.rpc.commitment import Confirmed
-            
             lamports = int(amount * 1e9)
             signature = self.client.request_airdrop(
                 self.keypair.pubkey(),
@@ -147,12 +236,11 @@ class SolanaWallet:
             logger.error(f"Amount {amount} exceeds limit {self.max_sol_per_tx}")
             return None
         
+        if Transaction is None:
+            logger.error("Transfers need solana.transaction, which this solana-py version doesn't have")
+            return None
+        
         try:
-            from solders.pubkey import Pubkey
-            from solana.transaction import Transaction
-            from solders.system_program import TransferParams, transfer
-            from solana.rpc.commitment import Confirmed
-            
             # Build transaction
             recipient = Pubkey.from_string(to_address)
             lamports = int(amount * 1e9)
@@ -166,15 +254,16 @@ class SolanaWallet:
             )
             
             # Get recent blockhash
-            blockhash_resp = self.client.get_latest_blockhash()
-            recent_blockhash = blockhash_resp.value.blockhash
+            self._start_refresher()
+            recent_blockhash = self._recent_blockhash()
             
             # Create and sign transaction
             tx = Transaction(recent_blockhash=recent_blockhash, fee_payer=self.keypair.pubkey())
             tx.add(transfer_ix)
             
             # Send transaction
-            response = self.client.send_transaction(tx, self.keypair)
+            # Passing the blockhash stops the client from fetching another one
+            response = self.client.send_transaction(tx, self.keypair, recent_blockhash=recent_blockhash)
             signature = response.value
             
             # Wait for confirmation
@@ -2,27 +2,50 @@
 """
 Live Agent Terminal - Web Server
 Stream multi-agent conversations to a live website
+
+Run with: hypercorn web_terminal:app --workers 1 -k asyncio -b 0.0.0.0:5001
 """
 
 import os
 import json
+import time
 import random
-import requests
+import aiohttp
 import asyncio
-from datetime import datetime
-from flask import Flask, render_template, Response
-from flask_cors import CORS
+from collections import deque
+from quart import Quart, render_template, Response
+from quart_cors import cors
 from dotenv import load_dotenv
-import time
 
 load_dotenv()
 
-app = Flask(__name__)
-CORS(app)
+app = cors(Quart(__name__))
 
 # Ollama settings
 OLLAMA_URL = "http://localhost:11434/api/chat"
-MODEL = "llama3.2:1b"
+MODEL = "llama3.2:1b-instruct-q4_K_M"
+
+# Eight messages of history plus a persona prompt stay under 1024 tokens,
+# so keep the KV cache small
+MODEL_OPTIONS = {"num_ctx": 1024, "num_batch": 128}
+
+# Keep the model loaded for good; every request resets Ollama's unload timer
+KEEP_ALIVE = -1
+
+# Longest message an agent gets; streaming stops once the model has written past it
+MAX_MESSAGE_CHARS = 150
+
+# Conversation openers
+_TOPICS = (
+    "gm frens, what we thinking about sol today",
+    "anyone see that new memecoin launch",
+    "just got rekt on a trade lol",
+    "feels like a good day to touch grass",
+    "the charts looking kinda spicy ngl",
+    "who's building something cool rn",
+    "solana szn incoming fr",
+    "just vibing what's everyone up to"
+)
 
 # Agent definitions
 AGENTS = [
@@ -81,9 +104,19 @@ AGENTS = [
 ]
 
 # Global conversation history
-conversation_history = []
+conversation_history = deque(maxlen=100)
+
+# One queue per connected /stream client; new messages are pushed to each
+SUBSCRIBERS = set()
+
+# Seconds without a message before a stream sends a keep-alive comment
+HEARTBEAT_SECONDS = 15
+
+# Speakers generated concurrently per round; Ollama only batches them into
+# one forward pass when the server runs with OLLAMA_NUM_PARALLEL >= this
+PREFETCH_TURNS = 3
 
-def generate_response(agent: dict, history: list) -> str:
+async def generate_response(session: aiohttp.ClientSession, agent: dict, history: list) -> str:
     """Generate response for an agent"""
     try:
         messages = [{"role": "system", "content": agent["prompt"]}]
@@ -91,7 +124,7 @@ def generate_response(agent: dict, history: list) -> str:
         # Add recent history
         for msg in history[-8:]:
             role = "assistant" if msg["speaker"] == agent["name"] else "user"
-            content = f"{msg['speaker']}: {msg['text']}" if role == "user" else msg["text"]
+            content = msg["rendered"] if role == "user" else msg["text"]
             messages.append({"role": role, "content": content})
         
         messages.append({
@@ -102,16 +135,36 @@ def generate_response(agent: dict, history: list) -> str:
         payload = {
             "model": MODEL,
             "messages": messages,
-            "stream": False,
-            "options": {"temperature": 0.9, "top_p": 0.95, "num_predict": 100}
+            "stream": True,
+            "keep_alive": KEEP_ALIVE,
+            "options": {**MODEL_OPTIONS, "temperature": 0.9, "top_p": 0.95, "num_predict": 50}
         }
         
-        response = requests.post(OLLAMA_URL, json=payload, timeout=30)
-        result = response.json()
-        content = result["message"]["content"].strip().strip('"').strip("'")
+        # Read tokens as they arrive and hang up once there's more than a message
+        parts = []
+        length = 0
+        async with session.post(
+            OLLAMA_URL,
+            json=payload,
+            timeout=aiohttp.ClientTimeout(total=30)
+        ) as response:
+            async for line in response.content:
+                if not line.strip():
+                    continue
+                chunk = json.loads(line)
+                piece = chunk.get("message", {}).get("content", "")
+                parts.append(piece)
+                length += len(piece)
+                if chunk.get("done"):
+                    break
+                if length > MAX_MESSAGE_CHARS:
+                    # Drop the connection so Ollama stops generating
+                    response.close()
+                    break
+        content = "".join(parts).strip().strip('"').strip("'")
         
-        if len(content) > 150:
-            content = content[:147] + "..."
+        if len(content) > MAX_MESSAGE_CHARS:
+            content = content[:MAX_MESSAGE_CHARS - 3] + "..."
         
         return content
         
@@ -119,84 +172,168 @@ def generate_response(agent: dict, history: list) -> str:
         return "..."
 
 
-def run_conversation():
-    """Background task to generate conversation"""
-    topics = [
-        "gm frens, what we thinking about sol today",
-        "anyone see that new memecoin launch",
-        "just got rekt on a trade lol",
-        "feels like a good day to touch grass",
-        "the charts looking kinda spicy ngl",
-        "who's building something cool rn",
-        "solana szn incoming fr",
-        "just vibing what's everyone up to"
-    ]
+async def warm_agent_prompt(session: aiohttp.ClientSession, agent: dict):
+    """Prefill one agent's system prompt so its turns reuse the cached prefix"""
+    payload = {
+        "model": MODEL,
+        "messages": [
+            {"role": "system", "content": agent["prompt"]},
+            {"role": "user", "content": "hi"}
+        ],
+        "stream": False,
+        "keep_alive": KEEP_ALIVE,
+        "options": {**MODEL_OPTIONS, "num_predict": 1}
+    }
+    async with session.post(
+        OLLAMA_URL,
+        json=payload,
+        timeout=aiohttp.ClientTimeout(total=120)
+    ) as response:
+        response.raise_for_status()
+
+
+async def warmup_model(session: aiohttp.ClientSession):
+    """
+    Load the model and every agent's system prompt before the first turn.
+    Each turn starts with the same system message byte-for-byte, and Ollama
+    gives a request the slot holding its longest cached prefix, so with
+    OLLAMA_NUM_PARALLEL >= len(AGENTS) no persona prompt is re-evaluated.
+    """
+    results = await asyncio.gather(
+        *(warm_agent_prompt(session, agent) for agent in AGENTS),
+        return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            print(f"Model warmup failed: {result}")
+            break
+
+
+def pick_speakers(last_speaker: str, count: int) -> list:
+    """Pick the next agents to talk, never the same one twice in a row"""
+    speakers = []
+    for _ in range(count):
+        available = [a for a in AGENTS if a["name"] != last_speaker]
+        agent = random.choice(available)
+        speakers.append(agent)
+        last_speaker = agent["name"]
+    return speakers
+
+
+async def generate_turns(session: aiohttp.ClientSession) -> list:
+    """Generate the next PREFETCH_TURNS messages concurrently from the current history"""
+    history = list(conversation_history)
+    speakers = pick_speakers(history[-1]["speaker"], PREFETCH_TURNS)
+    responses = await asyncio.gather(
+        *(generate_response(session, agent, history) for agent in speakers)
+    )
+    return list(zip(speakers, responses))
+
+
+async def conversation_loop():
+    """Keep the conversation going, generating upcoming turns while earlier ones are shown"""
+    async with aiohttp.ClientSession() as session:
+        await warmup_model(session)
+        next_turns = asyncio.create_task(generate_turns(session))
+        
+        while True:
+            try:
+                turns = await next_turns
+                
+                for i, (agent, response) in enumerate(turns):
+                    add_message({
+                        "speaker": agent["name"],
+                        "text": response,
+                        "color": agent["color"],
+                        "timestamp": time.strftime("%H:%M:%S")
+                    })
+                    
+                    # Start on the next turns while the last one of this batch is on screen
+                    if i == len(turns) - 1:
+                        next_turns = asyncio.create_task(generate_turns(session))
+                    
+                    await asyncio.sleep(3)  # 3 seconds between messages
+                
+            except Exception as e:
+                print(f"Error in conversation: {e}")
+                await asyncio.sleep(5)
+                next_turns = asyncio.create_task(generate_turns(session))
+
+
+def add_message(message: dict):
+    """Append a message to the history and push it to the stream clients"""
+    # How other agents see this message in their prompts, formatted once
+    message["rendered"] = f"{message['speaker']}: {message['text']}"
+    conversation_history.append(message)
     
+    for queue in SUBSCRIBERS:
+        if queue.full():
+            # A client this far behind only needs the newest messages
+            queue.get_nowait()
+        queue.put_nowait(message)
+
+
+async def run_conversation():
+    """Background task to generate conversation"""
     # Start conversation
     if not conversation_history:
         starter_agent = random.choice(AGENTS)
-        starter = random.choice(topics)
-        conversation_history.append({
+        starter = random.choice(_TOPICS)
+        add_message({
             "speaker": starter_agent["name"],
             "text": starter,
             "color": starter_agent["color"],
-            "timestamp": datetime.now().strftime("%H:%M:%S")
+            "timestamp": time.strftime("%H:%M:%S")
         })
     
-    while True:
-        try:
-            # Pick next agent
-            available = [a for a in AGENTS if a["name"] != conversation_history[-1]["speaker"]]
-            next_agent = random.choice(available)
-            
-            # Generate response
-            response = generate_response(next_agent, conversation_history)
-            
-            message = {
-                "speaker": next_agent["name"],
-                "text": response,
-                "color": next_agent["color"],
-                "timestamp": datetime.now().strftime("%H:%M:%S")
-            }
-            
-            conversation_history.append(message)
-            
-            # Keep only last 100 messages
-            if len(conversation_history) > 100:
-                conversation_history.pop(0)
-            
-            time.sleep(3)  # 3 seconds between messages
-            
-        except Exception as e:
-            print(f"Error in conversation: {e}")
-            time.sleep(5)
+    await conversation_loop()
+
+
+@app.before_serving
+async def start_conversation():
+    """Start the conversation on the server's event loop"""
+    app.conversation_task = asyncio.create_task(run_conversation())
 
 
 @app.route('/')
-def index():
+async def index():
     """Serve the terminal UI"""
-    return render_template('terminal.html')
+    return await render_template('terminal.html')
 
 
 @app.route('/stream')
-def stream():
+async def stream():
     """SSE endpoint for streaming messages"""
-    def generate():
-        last_sent = 0
-        while True:
-            if len(conversation_history) > last_sent:
-                for i in range(last_sent, len(conversation_history)):
-                    msg = conversation_history[i]
-                    data = json.dumps(msg)
-                    yield f"data: {data}\n\n"
-                last_sent = len(conversation_history)
-            time.sleep(0.5)
+    async def generate():
+        # Subscribe and snapshot together so nothing falls in between
+        queue = asyncio.Queue(maxsize=conversation_history.maxlen)
+        SUBSCRIBERS.add(queue)
+        history = list(conversation_history)
+        try:
+            for msg in history:
+                data = json.dumps(msg)
+                yield f"data: {data}\n\n"
+            
+            while True:
+                try:
+                    msg = await asyncio.wait_for(queue.get(), HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    # Keeps proxies from closing an idle stream
+                    yield ": ping\n\n"
+                    continue
+                data = json.dumps(msg)
+                yield f"data: {data}\n\n"
+        finally:
+            SUBSCRIBERS.discard(queue)
     
-    return Response(generate(), mimetype='text/event-stream')
+    response = Response(generate(), mimetype='text/event-stream')
+    # The stream is meant to stay open
+    response.timeout = None
+    return response
 
 
 @app.route('/api/agents')
-def get_agents():
+async def get_agents():
     """Get list of agents"""
     return json.dumps([{
         "name": a["name"],
@@ -205,17 +342,17 @@ def get_agents():
 
 
 if __name__ == "__main__":
-    # Start conversation in background thread
-    import threading
-    conversation_thread = threading.Thread(target=run_conversation, daemon=True)
-    conversation_thread.start()
-    
     print("\n" + "="*60)
     print("🐸 PLOI AGENT TERMINAL - LIVE WEB SERVER")
     print("="*60)
     print("\n✅ Starting web server...")
     print("🌐 Open: http://localhost:5000")
     print("📡 Agents will start talking in a few seconds...")
+    print(f"🧠 Model: {MODEL} (pull it first with: ollama pull {MODEL})")
+    # The setting belongs to the Ollama server process, so it can only be checked here
+    if int(os.getenv("OLLAMA_NUM_PARALLEL") or 0) < PREFETCH_TURNS:
+        print(f"💡 Start ollama with OLLAMA_NUM_PARALLEL={len(AGENTS)} to batch each round of {PREFETCH_TURNS} agents")
+    print("🚀 In production: hypercorn web_terminal:app --workers 1 -k asyncio")
     print("\nPress Ctrl+C to stop\n")
     
-    app.run(host='0.0.0.0', port=5001, debug=False)
+    app.run(host='0.0.0.0', port=5001)